@@ -0,0 +1,73 @@
+"""
+Lightweight CORS middleware for Secret Hitler Online.
+Adds CORS headers at the raw ASGI level without building Request/Response objects.
+"""
+from typing import Iterable, List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_PREFLIGHT_MAX_AGE = b"600"
+_PREFLIGHT_BODY = b"OK"
+
+
+class SimpleCORSMiddleware:
+    """
+    Pure-ASGI CORS middleware.
+
+    Allowed origins are echoed back together with credentials support, and
+    preflight requests are answered directly without reaching the app.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Iterable[str] = ("*",)) -> None:
+        self.app = app
+        origins = {origin.strip() for origin in allow_origins if origin.strip()}
+        self.allow_all_origins = "*" in origins
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in origins)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None or not (self.allow_all_origins or origin in self.allow_origins):
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        # Preflight: answer directly
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = cors_headers + [
+                (b"access-control-allow-methods", _ALLOW_METHODS),
+                (b"access-control-max-age", _PREFLIGHT_MAX_AGE),
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", b"%d" % len(_PREFLIGHT_BODY)),
+            ]
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": _PREFLIGHT_BODY})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
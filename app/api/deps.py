@@ -0,0 +1,22 @@
+"""
+Dependency providers for Secret Hitler Online API routes.
+Resolve the application-wide service singletons created in main.py.
+"""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..services.game_manager import GameManager
+    from ..services.ai_integration import AIIntegrationService
+
+
+def get_game_manager() -> "GameManager":
+    """Return the shared GameManager instance."""
+    # Imported lazily: main.py imports the routers, which import this module
+    from . import main
+    return main.game_manager
+
+
+def get_ai_integration() -> "AIIntegrationService":
+    """Return the shared AIIntegrationService instance."""
+    from . import main
+    return main.ai_integration
@@ -2,23 +2,28 @@
 FastAPI application for Secret Hitler Online.
 Provides REST API endpoints and WebSocket support for real-time gameplay.
 """
-from fastapi import FastAPI, HTTPException, Depends, Request, WebSocket, Query
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Depends, Request, WebSocket, WebSocketDisconnect, Query
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
-import json
+import os
+from datetime import datetime
 from typing import Dict, Any
 
+import msgpack
+import orjson
+
 from .models import (
     CreateGameRequest, JoinGameRequest, NominateChancellorRequest,
     VoteRequest, DiscardPolicyRequest, EnactPolicyRequest,
     PresidentialPowerRequest, ChatMessageRequest,
     APIResponse, ErrorResponse, GameStateResponse
 )
+from .cors import SimpleCORSMiddleware
+from .deps import get_game_manager, get_ai_integration
 from .routes import game, actions, state
 from .websocket_manager import WebSocketManager
-from ..services.game_manager import GameManager
+from ..services.game_manager import GameManager, GameNotFoundError
 from ..services.ai_integration import AIIntegrationService
 
 # Configure logging
@@ -26,7 +31,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Global services
-websocket_manager = WebSocketManager()
+websocket_manager = WebSocketManager(redis_url=os.getenv("REDIS_URL"))
 game_manager = GameManager(websocket_manager)
 ai_integration = AIIntegrationService(game_manager)
 
@@ -47,36 +52,33 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="Secret Hitler Online API",
     description="Real-time multiplayer Secret Hitler game API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
     # lifespan=lifespan  # Temporarily disabled for testing
 )
 
-# CORS middleware
+# CORS middleware (comma-separated CORS_ORIGINS; configure for production)
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    SimpleCORSMiddleware,
+    allow_origins=os.getenv("CORS_ORIGINS", "*").split(","),
 )
 
-# Dependency injection
-def get_game_manager() -> GameManager:
-    return game_manager
-
-def get_ai_integration() -> AIIntegrationService:
-    return ai_integration
-
 # Global exception handler
+@app.exception_handler(GameNotFoundError)
+async def game_not_found_handler(request: Request, exc: GameNotFoundError):
+    # Routes without their own error mapping (the read-only state routes) surface unknown games here
+    logger.exception("Game not found on %s", request.url.path)
+    return ORJSONResponse(
+        status_code=404,
+        content={"success": False, "error": "Not found", "details": {"message": str(exc)}}
+    )
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.exception("Unhandled exception on %s", request.url.path)
+    return ORJSONResponse(
         status_code=500,
-        content=ErrorResponse(
-            error="Internal server error",
-            details={"message": str(exc)}
-        ).model_dump()
+        content={"success": False, "error": "Internal server error", "details": {"message": str(exc)}}
     )
 
 # Include routers
@@ -104,6 +106,10 @@ async def health_check():
     """Health check endpoint for monitoring."""
     return {"status": "healthy", "service": "secret-hitler-api"}
 
+async def _send_reply(connection_id: int, message: Dict[str, Any], binary: bool) -> None:
+    """Reply to a client frame in the wire format the client used (msgpack or JSON)."""
+    await websocket_manager.send_to_connection(connection_id, websocket_manager.serialize(message, binary))
+
 # WebSocket endpoint
 @app.websocket("/ws/{game_id}")
 async def websocket_endpoint(
@@ -121,34 +127,48 @@ async def websocket_endpoint(
 
     try:
         while True:
-            # Receive message from client
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            # Receive message from client: binary frames carry msgpack, text frames JSON
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                break
+
+            binary = frame.get("bytes") is not None
+            if binary:
+                message = msgpack.unpackb(frame["bytes"], raw=False)
+            else:
+                message = orjson.loads(frame["text"])
 
             # Handle different message types
             message_type = message.get("type")
 
             if message_type == "ping":
-                # Handle ping/pong for connection health
-                pong_response = await websocket_manager.handle_ping(connection_id)
-                await websocket.send_text(json.dumps(pong_response))
+                # Application-level ping/pong for browser clients, which cannot send
+                # protocol ping frames; the pong is pre-formatted by the manager
+                if binary:
+                    pong = websocket_manager.serialize(await websocket_manager.handle_ping(connection_id), binary=True)
+                else:
+                    pong = await websocket_manager.handle_ping_text(connection_id)
+                await websocket_manager.send_to_connection(connection_id, pong)
 
             elif message_type == "subscribe":
                 # Client is subscribing to game updates (already handled in connect)
-                await websocket.send_text(json.dumps({
+                await _send_reply(connection_id, {
                     "type": "subscribed",
                     "game_id": game_id,
-                    "timestamp": json.dumps({"timestamp": "now"})  # Will be replaced with proper datetime
-                }))
+                    "timestamp": datetime.now().isoformat()
+                }, binary)
 
             else:
                 # Unknown message type
-                await websocket.send_text(json.dumps({
+                await _send_reply(connection_id, {
                     "type": "error",
                     "error": f"Unknown message type: {message_type}",
-                    "timestamp": json.dumps({"timestamp": "now"})
-                }))
+                    "timestamp": datetime.now().isoformat()
+                }, binary)
 
+    except WebSocketDisconnect:
+        # Normal client close; nothing to report
+        pass
     except Exception as e:
         logger.error(f"WebSocket error for connection {connection_id}: {e}")
     finally:
@@ -166,11 +186,19 @@ async def root():
     }
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
+
+    # Games live in process memory, so this entrypoint always runs a single worker;
+    # to use more cores, run one process per port behind a proxy (see README)
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # uvloop is not available on Windows; fall back to the stdlib loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets"
     )
\ No newline at end of file
@@ -2,7 +2,7 @@
 Pydantic models for Secret Hitler Online API contracts.
 """
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -33,35 +33,40 @@ class GameStatus(str, Enum):
 
 
 # Request Models
-class CreateGameRequest(BaseModel):
+class _RequestModel(BaseModel):
+    """Base for request bodies: immutable and strict about unknown fields."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+class CreateGameRequest(_RequestModel):
     creator_name: str = Field(..., min_length=1, max_length=50, description="Name of the player creating the game")
 
 
-class JoinGameRequest(BaseModel):
+class JoinGameRequest(_RequestModel):
     player_name: str = Field(..., min_length=1, max_length=50, description="Name of the joining player")
 
 
-class NominateChancellorRequest(BaseModel):
+class NominateChancellorRequest(_RequestModel):
     chancellor_id: str = Field(..., description="ID of the nominated chancellor")
 
 
-class VoteRequest(BaseModel):
+class VoteRequest(_RequestModel):
     vote: bool = Field(..., description="True for Ja, False for Nein")
 
 
-class DiscardPolicyRequest(BaseModel):
+class DiscardPolicyRequest(_RequestModel):
     policy: PolicyType = Field(..., description="Policy to discard")
 
 
-class EnactPolicyRequest(BaseModel):
+class EnactPolicyRequest(_RequestModel):
     policy: PolicyType = Field(..., description="Policy to enact")
 
 
-class PresidentialPowerRequest(BaseModel):
+class PresidentialPowerRequest(_RequestModel):
     target_player_id: Optional[str] = Field(None, description="Target player ID for powers that require one")
 
 
-class ChatMessageRequest(BaseModel):
+class ChatMessageRequest(_RequestModel):
     message: str = Field(..., min_length=1, max_length=500, description="Chat message content")
 
 
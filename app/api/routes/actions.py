@@ -2,29 +2,37 @@
 Player action routes for Secret Hitler Online.
 Handles all game actions like nominations, votes, policy play, etc.
 """
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any
 import logging
 
 from ..models import (
     NominateChancellorRequest, VoteRequest, DiscardPolicyRequest,
     EnactPolicyRequest, PresidentialPowerRequest, ChatMessageRequest,
-    APIResponse, ErrorResponse
+    APIResponse
 )
+from ..deps import get_game_manager, get_ai_integration
+from ..routing import ORJSONRoute
 from ...services.game_manager import GameManager
 from ...services.ai_integration import AIIntegrationService
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
-@router.post("/{game_id}/nominate", response_model=APIResponse)
+def _err(error: str, message: str) -> Dict[str, Any]:
+    """Build an ErrorResponse-shaped dict without constructing the model."""
+    return {"success": False, "error": error, "details": {"message": message}}
+
+@router.post("/{game_id}/nominate", responses={200: {"model": APIResponse}})
 async def nominate_chancellor(
     game_id: str,
     request: NominateChancellorRequest,
+    background_tasks: BackgroundTasks,
     player_id: str = Query(..., description="Player ID (from session/auth)"),
-    game_manager: GameManager = Depends(),
-    ai_integration: AIIntegrationService = Depends()
-) -> APIResponse:
+    game_manager: GameManager = Depends(get_game_manager),
+    ai_integration: AIIntegrationService = Depends(get_ai_integration)
+) -> ORJSONResponse:
     """
     Nominate a chancellor during election phase.
 
@@ -37,42 +45,37 @@ async def nominate_chancellor(
             game_id, player_id, request.chancellor_id
         )
 
-        # Process AI turns if needed
-        await ai_integration.process_ai_turns(game_id)
+        # Process AI turns in the background so the response isn't held up by them
+        background_tasks.add_task(ai_integration.process_ai_turns, game_id)
 
-        logger.info(f"Player {player_id} nominated {request.chancellor_id} in game {game_id}")
+        logger.info("Player %s nominated %s in game %s", player_id, request.chancellor_id, game_id)
 
-        return APIResponse(
-            success=True,
-            message="Chancellor nominated successfully",
-            data=result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Chancellor nominated successfully",
+            "data": result
+        })
     except ValueError as e:
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=400,
-            detail=ErrorResponse(
-                error="Invalid nomination",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Invalid nomination", str(e))
         )
     except Exception as e:
         logger.error(f"Failed to nominate chancellor in game {game_id}: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to nominate chancellor",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to nominate chancellor", str(e))
         )
 
-@router.post("/{game_id}/vote", response_model=APIResponse)
+@router.post("/{game_id}/vote", responses={200: {"model": APIResponse}})
 async def submit_vote(
     game_id: str,
     request: VoteRequest,
+    background_tasks: BackgroundTasks,
     player_id: str = Query(..., description="Player ID (from session/auth)"),
-    game_manager: GameManager = Depends(),
-    ai_integration: AIIntegrationService = Depends()
-) -> APIResponse:
+    game_manager: GameManager = Depends(get_game_manager),
+    ai_integration: AIIntegrationService = Depends(get_ai_integration)
+) -> ORJSONResponse:
     """
     Submit a vote during election phase.
 
@@ -83,42 +86,37 @@ async def submit_vote(
     try:
         result = await game_manager.submit_vote(game_id, player_id, request.vote)
 
-        # Process AI turns if needed
-        await ai_integration.process_ai_turns(game_id)
+        # Process AI turns in the background so the response isn't held up by them
+        background_tasks.add_task(ai_integration.process_ai_turns, game_id)
 
-        logger.info(f"Player {player_id} voted {'Ja' if request.vote else 'Nein'} in game {game_id}")
+        logger.info("Player %s voted %s in game %s", player_id, "Ja" if request.vote else "Nein", game_id)
 
-        return APIResponse(
-            success=True,
-            message="Vote submitted successfully",
-            data=result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Vote submitted successfully",
+            "data": result
+        })
     except ValueError as e:
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=400,
-            detail=ErrorResponse(
-                error="Invalid vote",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Invalid vote", str(e))
         )
     except Exception as e:
         logger.error(f"Failed to submit vote in game {game_id}: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to submit vote",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to submit vote", str(e))
         )
 
-@router.post("/{game_id}/discard", response_model=APIResponse)
+@router.post("/{game_id}/discard", responses={200: {"model": APIResponse}})
 async def discard_policy(
     game_id: str,
     request: DiscardPolicyRequest,
+    background_tasks: BackgroundTasks,
     player_id: str = Query(..., description="Player ID (from session/auth)"),
-    game_manager: GameManager = Depends(),
-    ai_integration: AIIntegrationService = Depends()
-) -> APIResponse:
+    game_manager: GameManager = Depends(get_game_manager),
+    ai_integration: AIIntegrationService = Depends(get_ai_integration)
+) -> ORJSONResponse:
     """
     Discard a policy as president during legislative session.
 
@@ -129,42 +127,37 @@ async def discard_policy(
     try:
         result = await game_manager.discard_policy(game_id, player_id, request.policy)
 
-        # Process AI turns if needed
-        await ai_integration.process_ai_turns(game_id)
+        # Process AI turns in the background so the response isn't held up by them
+        background_tasks.add_task(ai_integration.process_ai_turns, game_id)
 
-        logger.info(f"President {player_id} discarded {request.policy.value} in game {game_id}")
+        logger.info("President %s discarded %s in game %s", player_id, request.policy.value, game_id)
 
-        return APIResponse(
-            success=True,
-            message="Policy discarded successfully",
-            data=result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Policy discarded successfully",
+            "data": result
+        })
     except ValueError as e:
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=400,
-            detail=ErrorResponse(
-                error="Invalid discard",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Invalid discard", str(e))
         )
     except Exception as e:
         logger.error(f"Failed to discard policy in game {game_id}: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to discard policy",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to discard policy", str(e))
         )
 
-@router.post("/{game_id}/enact", response_model=APIResponse)
+@router.post("/{game_id}/enact", responses={200: {"model": APIResponse}})
 async def enact_policy(
     game_id: str,
     request: EnactPolicyRequest,
+    background_tasks: BackgroundTasks,
     player_id: str = Query(..., description="Player ID (from session/auth)"),
-    game_manager: GameManager = Depends(),
-    ai_integration: AIIntegrationService = Depends()
-) -> APIResponse:
+    game_manager: GameManager = Depends(get_game_manager),
+    ai_integration: AIIntegrationService = Depends(get_ai_integration)
+) -> ORJSONResponse:
     """
     Enact a policy as chancellor during legislative session.
 
@@ -175,42 +168,37 @@ async def enact_policy(
     try:
         result = await game_manager.enact_policy(game_id, player_id, request.policy)
 
-        # Process AI turns if needed
-        await ai_integration.process_ai_turns(game_id)
+        # Process AI turns in the background so the response isn't held up by them
+        background_tasks.add_task(ai_integration.process_ai_turns, game_id)
 
-        logger.info(f"Chancellor {player_id} enacted {request.policy.value} in game {game_id}")
+        logger.info("Chancellor %s enacted %s in game %s", player_id, request.policy.value, game_id)
 
-        return APIResponse(
-            success=True,
-            message="Policy enacted successfully",
-            data=result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Policy enacted successfully",
+            "data": result
+        })
     except ValueError as e:
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=400,
-            detail=ErrorResponse(
-                error="Invalid enactment",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Invalid enactment", str(e))
         )
     except Exception as e:
         logger.error(f"Failed to enact policy in game {game_id}: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to enact policy",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to enact policy", str(e))
         )
 
-@router.post("/{game_id}/power", response_model=APIResponse)
+@router.post("/{game_id}/power", responses={200: {"model": APIResponse}})
 async def use_presidential_power(
     game_id: str,
     request: PresidentialPowerRequest,
+    background_tasks: BackgroundTasks,
     player_id: str = Query(..., description="Player ID (from session/auth)"),
-    game_manager: GameManager = Depends(),
-    ai_integration: AIIntegrationService = Depends()
-) -> APIResponse:
+    game_manager: GameManager = Depends(get_game_manager),
+    ai_integration: AIIntegrationService = Depends(get_ai_integration)
+) -> ORJSONResponse:
     """
     Use a presidential power when available.
 
@@ -223,42 +211,37 @@ async def use_presidential_power(
             game_id, player_id, request.target_player_id
         )
 
-        # Process AI turns if needed
-        await ai_integration.process_ai_turns(game_id)
+        # Process AI turns in the background so the response isn't held up by them
+        background_tasks.add_task(ai_integration.process_ai_turns, game_id)
 
-        logger.info(f"President {player_id} used presidential power in game {game_id}")
+        logger.info("President %s used presidential power in game %s", player_id, game_id)
 
-        return APIResponse(
-            success=True,
-            message="Presidential power used successfully",
-            data=result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Presidential power used successfully",
+            "data": result
+        })
     except ValueError as e:
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=400,
-            detail=ErrorResponse(
-                error="Invalid presidential power",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Invalid presidential power", str(e))
         )
     except Exception as e:
         logger.error(f"Failed to use presidential power in game {game_id}: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to use presidential power",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to use presidential power", str(e))
         )
 
-@router.post("/{game_id}/chat", response_model=APIResponse)
+@router.post("/{game_id}/chat", responses={200: {"model": APIResponse}})
 async def send_chat_message(
     game_id: str,
     request: ChatMessageRequest,
+    background_tasks: BackgroundTasks,
     player_id: str = Query(..., description="Player ID (from session/auth)"),
-    game_manager: GameManager = Depends(),
-    ai_integration: AIIntegrationService = Depends()
-) -> APIResponse:
+    game_manager: GameManager = Depends(get_game_manager),
+    ai_integration: AIIntegrationService = Depends(get_ai_integration)
+) -> ORJSONResponse:
     """
     Send a chat message in the game.
 
@@ -269,30 +252,24 @@ async def send_chat_message(
     try:
         result = await game_manager.send_chat_message(game_id, player_id, request.message)
 
-        # Process AI chat responses if needed
-        await ai_integration.handle_ai_chat(game_id)
+        # Process AI chat responses in the background
+        background_tasks.add_task(ai_integration.handle_ai_chat, game_id)
 
-        logger.info(f"Player {player_id} sent chat message in game {game_id}")
+        logger.info("Player %s sent chat message in game %s", player_id, game_id)
 
-        return APIResponse(
-            success=True,
-            message="Chat message sent successfully",
-            data=result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Chat message sent successfully",
+            "data": result
+        })
     except ValueError as e:
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=400,
-            detail=ErrorResponse(
-                error="Invalid chat message",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Invalid chat message", str(e))
         )
     except Exception as e:
         logger.error(f"Failed to send chat message in game {game_id}: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to send chat message",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to send chat message", str(e))
         )
\ No newline at end of file
@@ -2,26 +2,32 @@
 Game management routes for Secret Hitler Online.
 Handles game creation, joining, starting, and leaving.
 """
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Response
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any
 import logging
 
 from ..models import (
-    CreateGameRequest, JoinGameRequest, APIResponse, ErrorResponse,
+    CreateGameRequest, JoinGameRequest, APIResponse,
     GameStateResponse
 )
-from ...services.game_manager import GameManager
+from ..deps import get_game_manager, get_ai_integration
+from ...services.game_manager import GameManager, GameNotFoundError
 from ...services.ai_integration import AIIntegrationService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-@router.post("/create", response_model=APIResponse)
+def _err(error: str, message: str) -> Dict[str, Any]:
+    """Build an ErrorResponse-shaped dict without constructing the model."""
+    return {"success": False, "error": error, "details": {"message": message}}
+
+@router.post("/create", responses={200: {"model": APIResponse}})
 async def create_game(
     request: CreateGameRequest,
-    game_manager: GameManager = Depends(),
-    ai_integration: AIIntegrationService = Depends()
-) -> APIResponse:
+    game_manager: GameManager = Depends(get_game_manager),
+    ai_integration: AIIntegrationService = Depends(get_ai_integration)
+) -> ORJSONResponse:
     """
     Create a new game room.
 
@@ -30,32 +36,29 @@ async def create_game(
     """
     try:
         game_id = await game_manager.create_game(request.creator_name)
-        logger.info(f"Game created: {game_id} by {request.creator_name}")
+        logger.info("Game created: %s by %s", game_id, request.creator_name)
 
         # Optionally fill with AI players for testing
         # await ai_integration.fill_with_ai_players(game_id)
 
-        return APIResponse(
-            success=True,
-            message="Game created successfully",
-            data={"game_id": game_id}
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Game created successfully",
+            "data": {"game_id": game_id}
+        })
     except Exception as e:
         logger.error(f"Failed to create game: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to create game",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to create game", str(e))
         )
 
-@router.post("/{game_id}/join", response_model=APIResponse)
+@router.post("/{game_id}/join", responses={200: {"model": APIResponse}})
 async def join_game(
     game_id: str,
     request: JoinGameRequest,
-    game_manager: GameManager = Depends()
-) -> APIResponse:
+    game_manager: GameManager = Depends(get_game_manager)
+) -> ORJSONResponse:
     """
     Join an existing game room.
 
@@ -64,37 +67,32 @@ async def join_game(
     """
     try:
         result = await game_manager.join_game(game_id, request.player_name)
-        logger.info(f"Player {request.player_name} joined game {game_id}")
+        logger.info("Player %s joined game %s", request.player_name, game_id)
 
-        return APIResponse(
-            success=True,
-            message="Joined game successfully",
-            data=result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Joined game successfully",
+            "data": result
+        })
     except ValueError as e:
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=400,
-            detail=ErrorResponse(
-                error="Cannot join game",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Cannot join game", str(e))
         )
     except Exception as e:
         logger.error(f"Failed to join game {game_id}: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to join game",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to join game", str(e))
         )
 
-@router.post("/{game_id}/start", response_model=APIResponse)
+@router.post("/{game_id}/start", responses={200: {"model": APIResponse}})
 async def start_game(
     game_id: str,
-    game_manager: GameManager = Depends(),
-    ai_integration: AIIntegrationService = Depends()
-) -> APIResponse:
+    background_tasks: BackgroundTasks,
+    game_manager: GameManager = Depends(get_game_manager),
+    ai_integration: AIIntegrationService = Depends(get_ai_integration)
+) -> ORJSONResponse:
     """
     Start a game when enough players have joined.
 
@@ -103,40 +101,34 @@ async def start_game(
     try:
         result = await game_manager.start_game(game_id)
 
-        # Process AI turns if needed
-        await ai_integration.process_ai_turns(game_id)
+        # Process AI turns in the background so the response isn't held up by them
+        background_tasks.add_task(ai_integration.process_ai_turns, game_id)
 
-        logger.info(f"Game {game_id} started successfully")
+        logger.info("Game %s started successfully", game_id)
 
-        return APIResponse(
-            success=True,
-            message="Game started successfully",
-            data=result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Game started successfully",
+            "data": result
+        })
     except ValueError as e:
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=400,
-            detail=ErrorResponse(
-                error="Cannot start game",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Cannot start game", str(e))
         )
     except Exception as e:
         logger.error(f"Failed to start game {game_id}: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to start game",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to start game", str(e))
         )
 
-@router.delete("/{game_id}", response_model=APIResponse)
+@router.delete("/{game_id}", responses={200: {"model": APIResponse}})
 async def leave_game(
     game_id: str,
     player_id: str = Query(..., description="Player ID (from session/auth)"),
-    game_manager: GameManager = Depends()
-) -> APIResponse:
+    game_manager: GameManager = Depends(get_game_manager)
+) -> ORJSONResponse:
     """
     Leave a game room.
 
@@ -145,35 +137,30 @@ async def leave_game(
     """
     try:
         await game_manager.leave_game(game_id, player_id)
-        logger.info(f"Player {player_id} left game {game_id}")
+        logger.info("Player %s left game %s", player_id, game_id)
 
-        return APIResponse(
-            success=True,
-            message="Left game successfully"
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Left game successfully",
+            "data": None
+        })
     except ValueError as e:
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=400,
-            detail=ErrorResponse(
-                error="Cannot leave game",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Cannot leave game", str(e))
         )
     except Exception as e:
         logger.error(f"Failed to leave game {game_id}: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to leave game",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to leave game", str(e))
         )
 
-@router.get("/{game_id}", response_model=GameStateResponse)
+@router.get("/{game_id}", responses={200: {"model": GameStateResponse}})
 async def get_game_state(
     game_id: str,
-    game_manager: GameManager = Depends()
-) -> GameStateResponse:
+    game_manager: GameManager = Depends(get_game_manager)
+) -> Response:
     """
     Get the current state of a game.
 
@@ -181,22 +168,17 @@ async def get_game_state(
     - Returns complete game state for the requesting player
     """
     try:
-        game_state = await game_manager.get_game_state(game_id)
-        return game_state
-    except ValueError as e:
-        raise HTTPException(
+        # Served from the manager's cached encoding while the game is unchanged
+        game_state = await game_manager.get_game_state_json(game_id)
+        return Response(content=game_state, media_type="application/json")
+    except GameNotFoundError as e:
+        return ORJSONResponse(
             status_code=404,
-            detail=ErrorResponse(
-                error="Game not found",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Game not found", str(e))
         )
     except Exception as e:
         logger.error(f"Failed to get game state for {game_id}: {e}")
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=500,
-            detail=ErrorResponse(
-                error="Failed to get game state",
-                details={"message": str(e)}
-            ).model_dump()
+            content=_err("Failed to get game state", str(e))
         )
\ No newline at end of file
@@ -1,24 +1,46 @@
 """
 Game state routes for Secret Hitler Online.
 Provides read-only access to game state, history, and available actions.
+Errors are mapped to responses by the app-level exception handlers in main.py.
 """
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional
 import logging
+import re
 
 from ..models import (
     PlayerResponse, BoardStateResponse, GameHistoryEntry,
-    AvailableActionsResponse, APIResponse, ErrorResponse
+    AvailableActionsResponse, APIResponse
 )
+from ..deps import get_game_manager
 from ...services.game_manager import GameManager
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# One entity tag in an If-None-Match list, e.g. W/"abc" or "abc"
+_ETAG_RE = re.compile(r'(?:W/)?"[^"]*"')
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weakness indicator from an entity tag."""
+    return etag[2:] if etag.startswith("W/") else etag
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response when the client already holds the current version."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+
+    # If-None-Match uses weak comparison: the W/ prefix is ignored on both sides
+    if if_none_match.strip() == "*" or _opaque_tag(etag) in map(_opaque_tag, _ETAG_RE.findall(if_none_match)):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
 
 @router.get("/{game_id}/players", response_model=List[PlayerResponse])
 async def get_players(
     game_id: str,
-    game_manager: GameManager = Depends()
+    game_manager: GameManager = Depends(get_game_manager)
 ) -> List[PlayerResponse]:
     """
     Get all players in a game.
@@ -26,64 +48,33 @@ async def get_players(
     - **game_id**: ID of the game
     - Returns list of player information (roles hidden appropriately)
     """
-    try:
-        players = await game_manager.get_players(game_id)
-        return players
-    except ValueError as e:
-        raise HTTPException(
-            status_code=404,
-            detail=ErrorResponse(
-                error="Game not found",
-                details={"message": str(e)}
-            ).model_dump()
-        )
-    except Exception as e:
-        logger.error(f"Failed to get players for game {game_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=ErrorResponse(
-                error="Failed to get players",
-                details={"message": str(e)}
-            ).model_dump()
-        )
-
-@router.get("/{game_id}/board", response_model=BoardStateResponse)
+    return await game_manager.get_players(game_id)
+
+@router.get("/{game_id}/board", responses={200: {"model": BoardStateResponse}})
 async def get_board_state(
     game_id: str,
-    game_manager: GameManager = Depends()
-) -> BoardStateResponse:
+    request: Request,
+    game_manager: GameManager = Depends(get_game_manager)
+) -> Response:
     """
     Get the current board state.
 
     - **game_id**: ID of the game
     - Returns policy counts, election tracker, and available powers
     """
-    try:
-        board_state = await game_manager.get_board_state(game_id)
-        return board_state
-    except ValueError as e:
-        raise HTTPException(
-            status_code=404,
-            detail=ErrorResponse(
-                error="Game not found",
-                details={"message": str(e)}
-            ).model_dump()
-        )
-    except Exception as e:
-        logger.error(f"Failed to get board state for game {game_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=ErrorResponse(
-                error="Failed to get board state",
-                details={"message": str(e)}
-            ).model_dump()
-        )
+    etag = game_manager.get_state_etag(game_id)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    board_state = await game_manager.get_board_state(game_id)
+    return ORJSONResponse(board_state, headers={"ETag": etag})
 
 @router.get("/{game_id}/history", response_model=List[GameHistoryEntry])
 async def get_game_history(
     game_id: str,
     limit: int = 50,
-    game_manager: GameManager = Depends()
+    game_manager: GameManager = Depends(get_game_manager)
 ) -> List[GameHistoryEntry]:
     """
     Get the game action history.
@@ -92,32 +83,13 @@ async def get_game_history(
     - **limit**: Maximum number of history entries to return (default: 50)
     - Returns chronological list of game events
     """
-    try:
-        history = await game_manager.get_game_history(game_id, limit)
-        return history
-    except ValueError as e:
-        raise HTTPException(
-            status_code=404,
-            detail=ErrorResponse(
-                error="Game not found",
-                details={"message": str(e)}
-            ).model_dump()
-        )
-    except Exception as e:
-        logger.error(f"Failed to get game history for {game_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=ErrorResponse(
-                error="Failed to get game history",
-                details={"message": str(e)}
-            ).model_dump()
-        )
+    return await game_manager.get_game_history(game_id, limit)
 
 @router.get("/{game_id}/available", response_model=AvailableActionsResponse)
 async def get_available_actions(
     game_id: str,
     player_id: str = Query(..., description="Player ID (from session/auth)"),
-    game_manager: GameManager = Depends()
+    game_manager: GameManager = Depends(get_game_manager)
 ) -> AvailableActionsResponse:
     """
     Get available actions for a specific player.
@@ -126,95 +98,52 @@ async def get_available_actions(
     - **player_id**: ID of the player (from auth)
     - Returns what actions the player can currently take
     """
-    try:
-        actions = await game_manager.get_available_actions(game_id, player_id)
-        return actions
-    except ValueError as e:
-        raise HTTPException(
-            status_code=404,
-            detail=ErrorResponse(
-                error="Game or player not found",
-                details={"message": str(e)}
-            ).model_dump()
-        )
-    except Exception as e:
-        logger.error(f"Failed to get available actions for player {player_id} in game {game_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=ErrorResponse(
-                error="Failed to get available actions",
-                details={"message": str(e)}
-            ).model_dump()
-        )
-
-@router.get("/{game_id}/phase", response_model=APIResponse)
+    return await game_manager.get_available_actions(game_id, player_id)
+
+@router.get("/{game_id}/phase", responses={200: {"model": APIResponse}})
 async def get_current_phase(
     game_id: str,
-    game_manager: GameManager = Depends()
-) -> APIResponse:
+    request: Request,
+    game_manager: GameManager = Depends(get_game_manager)
+) -> Response:
     """
     Get the current game phase.
 
     - **game_id**: ID of the game
     - Returns current phase and relevant phase data
     """
-    try:
-        phase_info = await game_manager.get_current_phase(game_id)
-        return APIResponse(
-            success=True,
-            message="Phase retrieved successfully",
-            data=phase_info
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=404,
-            detail=ErrorResponse(
-                error="Game not found",
-                details={"message": str(e)}
-            ).model_dump()
-        )
-    except Exception as e:
-        logger.error(f"Failed to get current phase for game {game_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=ErrorResponse(
-                error="Failed to get current phase",
-                details={"message": str(e)}
-            ).model_dump()
-        )
-
-@router.get("/{game_id}/turn", response_model=APIResponse)
+    etag = game_manager.get_state_etag(game_id)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    phase_info = await game_manager.get_current_phase(game_id)
+    return ORJSONResponse({
+        "success": True,
+        "message": "Phase retrieved successfully",
+        "data": phase_info
+    }, headers={"ETag": etag})
+
+@router.get("/{game_id}/turn", responses={200: {"model": APIResponse}})
 async def get_current_turn(
     game_id: str,
-    game_manager: GameManager = Depends()
-) -> APIResponse:
+    request: Request,
+    game_manager: GameManager = Depends(get_game_manager)
+) -> Response:
     """
     Get whose turn it currently is.
 
     - **game_id**: ID of the game
     - Returns current player turn information
     """
-    try:
-        turn_info = await game_manager.get_current_turn(game_id)
-        return APIResponse(
-            success=True,
-            message="Turn information retrieved successfully",
-            data=turn_info
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=404,
-            detail=ErrorResponse(
-                error="Game not found",
-                details={"message": str(e)}
-            ).model_dump()
-        )
-    except Exception as e:
-        logger.error(f"Failed to get current turn for game {game_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=ErrorResponse(
-                error="Failed to get current turn",
-                details={"message": str(e)}
-            ).model_dump()
-        )
\ No newline at end of file
+    etag = game_manager.get_state_etag(game_id)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    turn_info = await game_manager.get_current_turn(game_id)
+    return ORJSONResponse({
+        "success": True,
+        "message": "Turn information retrieved successfully",
+        "data": turn_info
+    }, headers={"ETag": etag})
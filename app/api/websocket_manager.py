@@ -3,44 +3,169 @@ WebSocket Manager for Secret Hitler Online.
 Handles real-time communication, connection management, and broadcasting.
 """
 import asyncio
-import json
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Set, Optional, Any
+import time
+import uuid
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Coroutine, Dict, List, Optional, Set, Tuple, Union
 from datetime import datetime, timedelta
 
+import msgpack
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocketState
 from ..api.models import WebSocketMessage, ConnectionStatusMessage
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis fan-out is optional; without it broadcasts stay in-process
+    aioredis = None
+
 logger = logging.getLogger(__name__)
 
+# Redis channel prefix for per-game broadcasts
+GAME_CHANNEL_PREFIX = "game:"
+
+# Number of recently published broadcast IDs remembered as already delivered locally
+LOCAL_DELIVERY_MEMORY = 256
+
+# Maximum number of outbound frames buffered per connection before it is dropped as a slow consumer
+OUTBOUND_QUEUE_SIZE = 64
+
+# Seconds without activity after which a connection is considered stale
+STALE_CONNECTION_TIMEOUT = 300.0
+
+# Seconds a writer waits after the first queued frame so a burst can go out as a single batch frame
+BATCH_WINDOW = 0.003
+
+# Clients offering this subprotocol receive msgpack binary frames instead of JSON text
+MSGPACK_SUBPROTOCOL = "secret-hitler.msgpack"
+
+# Latency upper bounds (exclusive, ms) for each connection quality label; anything slower is "poor"
+_QUALITY_THRESHOLDS = (100, 200, 500)
+_QUALITY_LABELS = ("excellent", "good", "fair", "poor")
+
+# Pong frames only differ in latency, quality and timestamp, so they are formatted directly
+_PONG_FORMAT = '{"type":"pong","latency_ms":%d,"quality":"%s","timestamp":"%s"}'
+_PONG_NOT_FOUND = '{"error":"Connection not found"}'
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode values msgpack has no native type for, matching the JSON output for datetimes."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+class NetworkQuality:
+    """Network quality of a single connection, slotted to keep per-connection memory small."""
+
+    __slots__ = ("latency_ms", "packet_loss", "quality", "last_ping")
+
+    def __init__(self) -> None:
+        self.latency_ms = 0
+        self.packet_loss = 0
+        self.quality = "good"
+        self.last_ping: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Build the reporting dict on demand."""
+        return {
+            "latency_ms": self.latency_ms,
+            "packet_loss": self.packet_loss,
+            "quality": self.quality,
+            "last_ping": self.last_ping
+        }
+
+# Reused for every msgpack frame instead of building a Packer per packb() call
+_MSGPACK_PACKER = msgpack.Packer(default=_msgpack_default)
+
+_BATCH_MSGPACK_PREFIX = msgpack.packb("type") + msgpack.packb("batch") + msgpack.packb("messages")
+
+def _batch_payload(batch: List[Union[str, bytes]]) -> Union[str, bytes]:
+    """Wrap already-encoded messages in one {"type": "batch", "messages": [...]} frame without re-encoding them."""
+    if isinstance(batch[0], bytes):
+        return (
+            _MSGPACK_PACKER.pack_map_header(2) + _BATCH_MSGPACK_PREFIX
+            + _MSGPACK_PACKER.pack_array_header(len(batch)) + b"".join(batch)
+        )
+    return '{"type":"batch","messages":[' + ",".join(batch) + "]}"
+
 class WebSocketManager:
     """Manages WebSocket connections and real-time communication."""
 
-    def __init__(self):
+    def __init__(self, redis_url: Optional[str] = None):
         # Active connections: connection_id -> WebSocket
-        self.active_connections: Dict[str, WebSocket] = {}
+        self.active_connections: Dict[int, WebSocket] = {}
 
-        # Game rooms: game_id -> set of connection_ids
-        self.game_rooms: Dict[str, Set[str]] = {}
+        # Game rooms: game_id -> {connection_id: WebSocket}
+        self.game_rooms: Dict[str, Dict[int, WebSocket]] = {}
 
         # Player connections: player_id -> connection_id
-        self.player_connections: Dict[str, str] = {}
+        self.player_connections: Dict[str, int] = {}
+
+        # Connection metadata, one dict per field keyed by connection_id; last_ping is monotonic
+        self._cid_game: Dict[int, str] = {}
+        self._cid_player: Dict[int, str] = {}
+        self._cid_connected_at: Dict[int, datetime] = {}
+        self._cid_last_ping: Dict[int, float] = {}
+
+        # Network quality tracking: connection_id -> NetworkQuality
+        self.network_quality: Dict[int, NetworkQuality] = {}
+
+        # Connections that negotiated MSGPACK_SUBPROTOCOL
+        self.binary_connections: Set[int] = set()
+
+        # Pending staleness checks: (monotonic deadline, connection_id), one entry per connection
+        self._expiry_heap: List[Tuple[float, int]] = []
 
-        # Connection metadata: connection_id -> {"game_id", "player_id", "connected_at", "last_ping"}
-        self.connection_metadata: Dict[str, Dict[str, Any]] = {}
+        # Outbound frames per connection, each drained by its own writer task
+        self.outbound_queues: Dict[int, asyncio.Queue] = {}
+        self.writer_tasks: Dict[int, asyncio.Task] = {}
 
-        # Network quality tracking: connection_id -> {"latency_ms", "packet_loss", "quality"}
-        self.network_quality: Dict[str, Dict[str, Any]] = {}
+        # Source of connection IDs; ints keep the per-connection dict and set keys cheap
+        self._id_counter = itertools.count(1)
 
         # Cleanup task
         self.cleanup_task: Optional[asyncio.Task] = None
 
+        # Fire-and-forget tasks; the event loop only holds weak references to them
+        self._background_tasks: Set[asyncio.Task] = set()
+
+        # Optional Redis pub/sub so broadcasts reach sockets held by other app instances
+        self.redis = None
+        self.subscribe_task: Optional[asyncio.Task] = None
+        # True only while the subscriber is listening, i.e. while our own publishes come back to us
+        self._subscribed = False
+        # IDs of published broadcasts this instance already delivered itself; the
+        # subscriber drops its copy if one arrives (used as a bounded ordered set)
+        self._delivered_locally: "OrderedDict[str, None]" = OrderedDict()
+        if redis_url:
+            if aioredis is None:
+                logger.warning("REDIS_URL is set but the redis package is not installed; broadcasting locally only")
+            else:
+                self.redis = aioredis.from_url(redis_url)
+
     async def start_cleanup_task(self) -> None:
-        """Start the background cleanup task."""
+        """Start the background cleanup task (and the Redis subscriber when configured)."""
         if self.cleanup_task is None or self.cleanup_task.done():
             self.cleanup_task = asyncio.create_task(self._cleanup_stale_connections())
 
-    async def connect(self, websocket: WebSocket, game_id: str, player_id: str) -> str:
+        self._start_subscriber()
+
+    def _start_subscriber(self) -> None:
+        """Start the Redis subscriber if Redis is configured and it is not already running."""
+        if self.redis and (self.subscribe_task is None or self.subscribe_task.done()):
+            self.subscribe_task = asyncio.create_task(self._subscribe_loop())
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a coroutine in the background, keeping the task alive until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def connect(self, websocket: WebSocket, game_id: str, player_id: str) -> int:
         """
         Accept a WebSocket connection and add it to the game room.
 
@@ -52,18 +177,28 @@ class WebSocketManager:
         Returns:
             connection_id: Unique identifier for this connection
         """
-        await websocket.accept()
-
         # Generate unique connection ID
-        connection_id = f"{player_id}_{game_id}_{id(websocket)}"
+        connection_id = next(self._id_counter)
+
+        if MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", ()):
+            await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL)
+            self.binary_connections.add(connection_id)
+        else:
+            await websocket.accept()
 
         # Store connection
         self.active_connections[connection_id] = websocket
 
+        # Broadcasts only come back through Redis once something is subscribed
+        self._start_subscriber()
+
+        # Start the connection's writer
+        queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self.outbound_queues[connection_id] = queue
+        self.writer_tasks[connection_id] = asyncio.create_task(self._writer(connection_id, websocket, queue))
+
         # Add to game room
-        if game_id not in self.game_rooms:
-            self.game_rooms[game_id] = set()
-        self.game_rooms[game_id].add(connection_id)
+        self.game_rooms.setdefault(game_id, {})[connection_id] = websocket
 
         # Update player connection (disconnect previous if exists)
         if player_id in self.player_connections:
@@ -73,32 +208,27 @@ class WebSocketManager:
         self.player_connections[player_id] = connection_id
 
         # Store metadata
-        self.connection_metadata[connection_id] = {
-            "game_id": game_id,
-            "player_id": player_id,
-            "connected_at": datetime.now(),
-            "last_ping": datetime.now()
-        }
+        now = time.monotonic()
+        self._cid_game[connection_id] = game_id
+        self._cid_player[connection_id] = player_id
+        self._cid_connected_at[connection_id] = datetime.now()
+        self._cid_last_ping[connection_id] = now
+        heapq.heappush(self._expiry_heap, (now + STALE_CONNECTION_TIMEOUT, connection_id))
 
         # Initialize network quality tracking
-        self.network_quality[connection_id] = {
-            "latency_ms": 0,
-            "packet_loss": 0,
-            "quality": "good"
-        }
+        self.network_quality[connection_id] = NetworkQuality()
 
-        logger.info(f"WebSocket connected: {connection_id} (player: {player_id}, game: {game_id})")
+        logger.info("WebSocket connected: %s (player: %s, game: %s)", connection_id, player_id, game_id)
 
         # Send connection confirmation
-        await self._send_to_connection(connection_id, {
+        await self._send_message(connection_id, {
             "type": "connection_established",
-            "connection_id": connection_id,
-            "timestamp": datetime.now().isoformat()
+            "connection_id": connection_id
         })
 
         return connection_id
 
-    async def disconnect(self, connection_id: str, reason: str = "client_disconnect") -> None:
+    async def disconnect(self, connection_id: int, reason: str = "client_disconnect") -> None:
         """
         Disconnect a WebSocket connection.
 
@@ -108,22 +238,29 @@ class WebSocketManager:
         """
         await self._disconnect_connection(connection_id, reason)
 
-    async def _disconnect_connection(self, connection_id: str, reason: str) -> None:
+    async def _disconnect_connection(self, connection_id: int, reason: str) -> None:
         """Internal method to handle disconnection."""
         if connection_id not in self.active_connections:
             return
 
-        # Get metadata before cleanup
-        metadata = self.connection_metadata.get(connection_id, {})
-        game_id = metadata.get("game_id")
-        player_id = metadata.get("player_id")
+        # Clean up metadata
+        game_id = self._cid_game.pop(connection_id, None)
+        player_id = self._cid_player.pop(connection_id, None)
+        self._cid_connected_at.pop(connection_id, None)
+        self._cid_last_ping.pop(connection_id, None)
 
         # Remove from active connections
         websocket = self.active_connections.pop(connection_id)
 
+        # Stop the writer; frames still queued are dropped
+        self.outbound_queues.pop(connection_id, None)
+        writer = self.writer_tasks.pop(connection_id, None)
+        if writer and writer is not asyncio.current_task():
+            writer.cancel()
+
         # Remove from game room
         if game_id and game_id in self.game_rooms:
-            self.game_rooms[game_id].discard(connection_id)
+            self.game_rooms[game_id].pop(connection_id, None)
             if not self.game_rooms[game_id]:
                 del self.game_rooms[game_id]
 
@@ -131,50 +268,125 @@ class WebSocketManager:
         if player_id and self.player_connections.get(player_id) == connection_id:
             del self.player_connections[player_id]
 
-        # Clean up metadata
-        if connection_id in self.connection_metadata:
-            del self.connection_metadata[connection_id]
-
         if connection_id in self.network_quality:
             del self.network_quality[connection_id]
 
+        self.binary_connections.discard(connection_id)
+
         # Close WebSocket if still open
         try:
             await websocket.close(code=1000, reason=reason)
         except Exception as e:
-            logger.warning(f"Error closing WebSocket {connection_id}: {e}")
+            logger.warning("Error closing WebSocket %s: %s", connection_id, e)
 
-        logger.info(f"WebSocket disconnected: {connection_id} (reason: {reason})")
+        logger.info("WebSocket disconnected: %s (reason: %s)", connection_id, reason)
 
     async def broadcast_to_game(self, game_id: str, message: Dict[str, Any]) -> None:
         """
         Broadcast a message to all connections in a game room.
 
+        With Redis configured the message is published once and every app instance
+        delivers it to the sockets it holds. This instance delivers locally instead
+        whenever its own subscriber is not listening (not started yet or reconnecting).
+
         Args:
             game_id: ID of the game room
             message: Message to broadcast
         """
+        if self.redis:
+            message_id = uuid.uuid4().hex
+            subscribed = self._subscribed
+            if not subscribed:
+                # Recorded before publishing: the subscriber may come up and see the
+                # message while the publish is still in flight
+                self._remember_local_delivery(message_id)
+            try:
+                await self.redis.publish(
+                    f"{GAME_CHANNEL_PREFIX}{game_id}",
+                    orjson.dumps({"id": message_id, "message": message})
+                )
+                if subscribed:
+                    return
+            except Exception as e:
+                logger.error("Failed to publish broadcast for game %s, delivering locally: %s", game_id, e)
+
+        await self._broadcast_local(game_id, message)
+
+    def _remember_local_delivery(self, message_id: str) -> None:
+        """Record a published broadcast as delivered locally, forgetting the oldest beyond the limit."""
+        delivered = self._delivered_locally
+        delivered[message_id] = None
+        if len(delivered) > LOCAL_DELIVERY_MEMORY:
+            delivered.popitem(last=False)
+
+    async def _subscribe_loop(self) -> None:
+        """Deliver broadcasts published by any app instance to the local game rooms."""
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.redis.pubsub()
+                await pubsub.psubscribe(f"{GAME_CHANNEL_PREFIX}*")
+                self._subscribed = True
+
+                async for event in pubsub.listen():
+                    if event["type"] != "pmessage":
+                        continue
+
+                    envelope = orjson.loads(event["data"])
+                    if envelope["id"] in self._delivered_locally:
+                        # Published while we were not subscribed, so already delivered
+                        del self._delivered_locally[envelope["id"]]
+                        continue
+
+                    game_id = event["channel"].decode()[len(GAME_CHANNEL_PREFIX):]
+                    if game_id in self.game_rooms:
+                        await self._broadcast_local(game_id, envelope["message"])
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error in Redis subscriber: %s", e)
+            finally:
+                self._subscribed = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception as e:
+                        logger.warning("Error closing Redis pubsub: %s", e)
+
+            await asyncio.sleep(1)  # Wait before resubscribing
+
+    async def _broadcast_local(self, game_id: str, message: Dict[str, Any]) -> None:
+        """Broadcast a message to the connections in a game room held by this process."""
         if game_id not in self.game_rooms:
-            logger.warning(f"Attempted to broadcast to non-existent game room: {game_id}")
+            logger.warning("Attempted to broadcast to non-existent game room: %s", game_id)
             return
 
-        connection_ids = self.game_rooms[game_id].copy()
-        message["timestamp"] = datetime.now().isoformat()
+        # Stamp a copy so the caller's dict is left untouched
+        message = {**message, "timestamp": datetime.now()}
+        payloads: Dict[bool, Union[str, bytes]] = {}
 
         successful_sends = 0
         failed_sends = 0
 
-        for connection_id in connection_ids:
-            try:
-                await self._send_to_connection(connection_id, message)
+        # Queue to sockets that are still open, serializing once per wire format in use;
+        # the writers do the actual sends, so a slow client never holds up the others
+        for connection_id, websocket in self.game_rooms[game_id].items():
+            if websocket.client_state != WebSocketState.CONNECTED:
+                continue
+
+            binary = connection_id in self.binary_connections
+            payload = payloads.get(binary)
+            if payload is None:
+                payload = payloads[binary] = self.serialize(message, binary)
+
+            if self._enqueue(connection_id, payload):
                 successful_sends += 1
-            except Exception as e:
-                logger.warning(f"Failed to send message to {connection_id}: {e}")
+            else:
                 failed_sends += 1
-                # Mark connection for cleanup
-                await self._disconnect_connection(connection_id, "send_failed")
 
-        logger.debug(f"Broadcast to game {game_id}: {successful_sends} successful, {failed_sends} failed")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Broadcast to game %s: %d successful, %d failed", game_id, successful_sends, failed_sends)
 
     async def send_to_player(self, player_id: str, message: Dict[str, Any]) -> None:
         """
@@ -186,57 +398,110 @@ class WebSocketManager:
         """
         connection_id = self.player_connections.get(player_id)
         if not connection_id:
-            logger.warning(f"No active connection for player {player_id}")
+            logger.warning("No active connection for player %s", player_id)
             return
 
-        message["timestamp"] = datetime.now().isoformat()
-        await self._send_to_connection(connection_id, message)
+        await self._send_message(connection_id, message)
+
+    def serialize(self, message: Dict[str, Any], binary: bool) -> Union[str, bytes]:
+        """Serialize a message as msgpack bytes or JSON text."""
+        if binary:
+            return _MSGPACK_PACKER.pack(message)
+        # orjson encodes datetimes natively, including any the caller put in the message
+        return orjson.dumps(message).decode()
+
+    def _encode(self, message: Dict[str, Any], binary: bool = False) -> Union[str, bytes]:
+        """Stamp a message with the current time and serialize it for sending."""
+        message["timestamp"] = datetime.now()
+        return self.serialize(message, binary)
+
+    async def _send_message(self, connection_id: int, message: Dict[str, Any]) -> None:
+        """Send a message to a specific connection in its negotiated wire format."""
+        await self.send_to_connection(connection_id, self._encode(message, connection_id in self.binary_connections))
 
-    async def _send_to_connection(self, connection_id: str, message: Dict[str, Any]) -> None:
-        """Send a message to a specific connection."""
+    async def send_to_connection(self, connection_id: int, payload: Union[str, bytes]) -> None:
+        """Queue an already-encoded message (JSON text or msgpack bytes) for a specific connection."""
         if connection_id not in self.active_connections:
             raise ValueError(f"Connection {connection_id} not found")
 
-        websocket = self.active_connections[connection_id]
+        self._enqueue(connection_id, payload)
 
-        # Convert message to JSON
-        json_message = json.dumps(message)
-
-        # Send message
-        await websocket.send_text(json_message)
+    def _enqueue(self, connection_id: int, payload: Union[str, bytes]) -> bool:
+        """Hand a payload to the connection's writer, dropping the connection if it has fallen behind."""
+        try:
+            self.outbound_queues[connection_id].put_nowait(payload)
+            return True
+        except KeyError:
+            return False
+        except asyncio.QueueFull:
+            logger.warning("Outbound queue full for %s, disconnecting slow consumer", connection_id)
+            # Stop accepting frames right away; the disconnect itself completes asynchronously
+            del self.outbound_queues[connection_id]
+            self._spawn(self._disconnect_connection(connection_id, "slow_consumer"))
+            return False
+
+    async def _writer(self, connection_id: int, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Drain a connection's outbound queue onto its socket, coalescing bursts into batch frames."""
+        while True:
+            payload = await queue.get()
+
+            await asyncio.sleep(BATCH_WINDOW)
+            frames = [payload]
+            while not queue.empty():
+                frames.append(queue.get_nowait())
+
+            # Replies use the wire format of the client frame they answer, so a burst
+            # may mix text and binary; each run of one format becomes its own frame
+            for _, run in itertools.groupby(frames, type):
+                run = list(run)
+                payload = run[0] if len(run) == 1 else _batch_payload(run)
+                try:
+                    await self._send_to_socket(connection_id, websocket, payload)
+                except Exception as e:
+                    logger.warning("Failed to send message to %s: %s", connection_id, e)
+                    # Clean up from a separate task since disconnecting cancels this writer
+                    self._spawn(self._disconnect_connection(connection_id, "send_failed"))
+                    return
+
+    async def _send_to_socket(self, connection_id: int, websocket: WebSocket, payload: Union[str, bytes]) -> None:
+        """Send an already-encoded message on a known socket and record the activity."""
+        if isinstance(payload, bytes):
+            await websocket.send_bytes(payload)
+        else:
+            await websocket.send_text(payload)
 
         # Update last activity
-        if connection_id in self.connection_metadata:
-            self.connection_metadata[connection_id]["last_ping"] = datetime.now()
+        if connection_id in self._cid_last_ping:
+            self._cid_last_ping[connection_id] = time.monotonic()
 
-    async def handle_ping(self, connection_id: str) -> Dict[str, Any]:
-        """Handle a ping from a client and return pong with latency info."""
-        if connection_id not in self.connection_metadata:
-            return {"error": "Connection not found"}
+    def _record_ping(self, connection_id: int) -> Optional[Tuple[int, str, datetime]]:
+        """Update network quality for a ping and return (latency_ms, quality, now)."""
+        if connection_id not in self._cid_last_ping:
+            return None
 
         now = datetime.now()
-        metadata = self.connection_metadata[connection_id]
-        last_ping = metadata.get("last_ping", now)
 
         # Calculate latency (simplified)
-        latency_ms = int((now - last_ping).total_seconds() * 1000)
+        latency_ms = int((time.monotonic() - self._cid_last_ping[connection_id]) * 1000)
+
+        # Determine connection quality
+        quality = _QUALITY_LABELS[bisect_right(_QUALITY_THRESHOLDS, latency_ms)]
 
         # Update network quality
-        self.network_quality[connection_id]["latency_ms"] = latency_ms
-        self.network_quality[connection_id]["last_ping"] = now
+        network_quality = self.network_quality[connection_id]
+        network_quality.latency_ms = latency_ms
+        network_quality.last_ping = now
+        network_quality.quality = quality
 
-        # Determine connection quality
-        if latency_ms < 100:
-            quality = "excellent"
-        elif latency_ms < 200:
-            quality = "good"
-        elif latency_ms < 500:
-            quality = "fair"
-        else:
-            quality = "poor"
+        return latency_ms, quality, now
 
-        self.network_quality[connection_id]["quality"] = quality
+    async def handle_ping(self, connection_id: int) -> Dict[str, Any]:
+        """Handle a ping from a client and return pong with latency info."""
+        ping = self._record_ping(connection_id)
+        if ping is None:
+            return {"error": "Connection not found"}
 
+        latency_ms, quality, now = ping
         return {
             "type": "pong",
             "latency_ms": latency_ms,
@@ -244,20 +509,32 @@ class WebSocketManager:
             "timestamp": now.isoformat()
         }
 
-    async def get_connection_info(self, connection_id: str) -> Optional[Dict[str, Any]]:
+    async def handle_ping_text(self, connection_id: int) -> str:
+        """Handle a ping from a client and return the pong already encoded as JSON text."""
+        ping = self._record_ping(connection_id)
+        if ping is None:
+            return _PONG_NOT_FOUND
+
+        latency_ms, quality, now = ping
+        return _PONG_FORMAT % (latency_ms, quality, now.isoformat())
+
+    def get_connection_info(self, connection_id: int) -> Optional[Dict[str, Any]]:
         """Get information about a connection."""
-        if connection_id not in self.connection_metadata:
+        if connection_id not in self._cid_last_ping:
             return None
 
-        metadata = self.connection_metadata[connection_id]
-        network_info = self.network_quality.get(connection_id, {})
+        network_quality = self.network_quality.get(connection_id)
+        network_info = network_quality.to_dict() if network_quality else {}
+
+        # last_ping is monotonic; convert to wall-clock time only for reporting
+        last_ping = datetime.now() - timedelta(seconds=time.monotonic() - self._cid_last_ping[connection_id])
 
         return {
             "connection_id": connection_id,
-            "game_id": metadata.get("game_id"),
-            "player_id": metadata.get("player_id"),
-            "connected_at": metadata.get("connected_at").isoformat(),
-            "last_ping": metadata.get("last_ping").isoformat(),
+            "game_id": self._cid_game[connection_id],
+            "player_id": self._cid_player[connection_id],
+            "connected_at": self._cid_connected_at[connection_id].isoformat(),
+            "last_ping": last_ping.isoformat(),
             "network_quality": network_info
         }
 
@@ -266,37 +543,38 @@ class WebSocketManager:
         if game_id not in self.game_rooms:
             return []
 
-        connection_ids = self.game_rooms[game_id]
-        connections = []
-
-        for connection_id in connection_ids:
-            info = await self.get_connection_info(connection_id)
-            if info:
-                connections.append(info)
-
-        return connections
+        return [
+            info for info in map(self.get_connection_info, self.game_rooms[game_id])
+            if info
+        ]
 
     async def _cleanup_stale_connections(self) -> None:
         """Background task to clean up stale connections."""
+        heap = self._expiry_heap
         while True:
             try:
-                await asyncio.sleep(30)  # Check every 30 seconds
-
-                now = datetime.now()
-                stale_threshold = timedelta(minutes=5)  # 5 minutes without ping
-                stale_connections = []
-
-                for connection_id, metadata in self.connection_metadata.items():
-                    last_ping = metadata.get("last_ping", metadata.get("connected_at", now))
-                    if now - last_ping > stale_threshold:
-                        stale_connections.append(connection_id)
-
-                for connection_id in stale_connections:
-                    logger.info(f"Cleaning up stale connection: {connection_id}")
-                    await self._disconnect_connection(connection_id, "stale_connection")
+                now = time.monotonic()
+
+                # Only connections whose deadline has passed are examined; activity since a
+                # deadline was scheduled just pushes it back rather than adding heap entries
+                while heap and heap[0][0] <= now:
+                    _, connection_id = heapq.heappop(heap)
+                    last_ping = self._cid_last_ping.get(connection_id)
+                    if last_ping is None:
+                        continue  # Already disconnected
+
+                    deadline = last_ping + STALE_CONNECTION_TIMEOUT
+                    if deadline > now:
+                        heapq.heappush(heap, (deadline, connection_id))
+                    else:
+                        logger.info("Cleaning up stale connection: %s", connection_id)
+                        await self._disconnect_connection(connection_id, "stale_connection")
+
+                # Sleep until the earliest deadline; new connections are never due sooner than the timeout
+                await asyncio.sleep(heap[0][0] - now if heap else STALE_CONNECTION_TIMEOUT)
 
             except Exception as e:
-                logger.error(f"Error in cleanup task: {e}")
+                logger.error("Error in cleanup task: %s", e)
                 await asyncio.sleep(30)  # Wait before retrying
 
     async def shutdown(self) -> None:
@@ -311,9 +589,20 @@ class WebSocketManager:
             except asyncio.CancelledError:
                 pass
 
+        # Stop the Redis subscriber
+        if self.subscribe_task and not self.subscribe_task.done():
+            self.subscribe_task.cancel()
+            try:
+                await self.subscribe_task
+            except asyncio.CancelledError:
+                pass
+
         # Close all connections
         connection_ids = list(self.active_connections.keys())
         for connection_id in connection_ids:
             await self._disconnect_connection(connection_id, "server_shutdown")
 
+        if self.redis:
+            await self.redis.aclose()
+
         logger.info("WebSocket manager shutdown complete")
\ No newline at end of file
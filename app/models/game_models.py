@@ -12,15 +12,16 @@ Model Relationships:
   - Tracks: Election progress, policy counts, government history
   - Manages: Presidential powers, investigations, eliminations
 - Player: Individual player data
-  - Properties: Role (Liberal/Fascist/Hitler), Party (computed), status
+  - Properties: Role (Liberal/Fascist/Hitler), Party (derived from role), status
   - Relationships: Investigated by other players, alive/dead status
 
 All models support JSON serialization for real-time game updates.
 """
 
+import random
 from enum import StrEnum
-from typing import Dict, List, Optional, Tuple
-from pydantic import BaseModel, computed_field
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
 
 
 class Role(StrEnum):
@@ -61,6 +62,50 @@ class PresidentialPower(StrEnum):
     EXECUTION = "execution"
 
 
+# Role distribution for each supported player count.
+_ROLE_COMPOSITIONS: Dict[int, Tuple[Role, ...]] = {
+    5: (Role.LIBERAL,) * 3 + (Role.FASCIST,) + (Role.HITLER,),
+    6: (Role.LIBERAL,) * 4 + (Role.FASCIST,) + (Role.HITLER,),
+    7: (Role.LIBERAL,) * 4 + (Role.FASCIST,) * 2 + (Role.HITLER,),
+    8: (Role.LIBERAL,) * 5 + (Role.FASCIST,) * 2 + (Role.HITLER,),
+    9: (Role.LIBERAL,) * 5 + (Role.FASCIST,) * 3 + (Role.HITLER,),
+    10: (Role.LIBERAL,) * 6 + (Role.FASCIST,) * 3 + (Role.HITLER,),
+}
+
+# Role -> (party, is on the fascist team, is Hitler).
+_ROLE_TRAITS: Dict[Role, Tuple[Party, bool, bool]] = {
+    Role.LIBERAL: (Party.LIBERAL, False, False),
+    Role.FASCIST: (Party.FASCIST, True, False),
+    Role.HITLER: (Party.FASCIST, True, True),
+}
+
+# Unshuffled starting deck: 6 liberal and 11 fascist policies.
+_INITIAL_POLICY_DECK: Tuple[PolicyType, ...] = (PolicyType.LIBERAL,) * 6 + (PolicyType.FASCIST,) * 11
+
+# Presidential power by (9+ players alive, fascist policies enacted).
+_POWER_TABLE: Dict[Tuple[bool, int], PresidentialPower] = {
+    (False, 1): PresidentialPower.NONE,
+    (False, 2): PresidentialPower.INVESTIGATE_LOYALTY,
+    (False, 3): PresidentialPower.CALL_SPECIAL_ELECTION,
+    (False, 4): PresidentialPower.EXECUTION,
+    (False, 5): PresidentialPower.EXECUTION,
+    (True, 1): PresidentialPower.INVESTIGATE_LOYALTY,
+    (True, 2): PresidentialPower.CALL_SPECIAL_ELECTION,
+    (True, 3): PresidentialPower.POLICY_PEEK,
+    (True, 4): PresidentialPower.EXECUTION,
+    (True, 5): PresidentialPower.EXECUTION,
+}
+
+
+class _VersionCounter:
+    """Mutable version number shared by a Game and the players seated in it."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+
 class Player(BaseModel):
     """
     Represents a player in the Secret Hitler game.
@@ -72,6 +117,9 @@ class Player(BaseModel):
         is_human: Whether this is a human player or AI.
         is_alive: Whether the player is still alive in the game.
         investigated_by: ID of the player who investigated this player (if any).
+
+    Once a Game has indexed its players, assigning any of these fields bumps
+    that game's version, so data cached against it is rebuilt.
     """
     id: str
     name: str
@@ -80,22 +128,29 @@ class Player(BaseModel):
     is_alive: bool = True
     investigated_by: Optional[str] = None
 
+    # Version counter of the game this player is seated in; set by Game
+    _game_version: Optional[_VersionCounter] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            counter = self._game_version
+            if counter is not None:
+                counter.value += 1
+
     @computed_field
     @property
     def party(self) -> Party:
         """The player's political party (derived from role)."""
-        if self.role == Role.LIBERAL:
-            return Party.LIBERAL
-        else:  # Role.FASCIST or Role.HITLER
-            return Party.FASCIST
+        return _ROLE_TRAITS[self.role][0]
 
     def is_fascist(self) -> bool:
         """Check if the player is on the fascist team."""
-        return self.party == Party.FASCIST
+        return _ROLE_TRAITS[self.role][1]
 
     def is_hitler(self) -> bool:
         """Check if the player is Hitler."""
-        return self.role == Role.HITLER
+        return _ROLE_TRAITS[self.role][2]
 
 
 class GameState(BaseModel):
@@ -117,19 +172,22 @@ class GameState(BaseModel):
         power_target_id: Target player ID for the current power.
         investigated_players: Map of player_id -> revealed party.
     """
+    # Mutated on nearly every action, so never revalidate on assignment
+    model_config = ConfigDict(validate_assignment=False)
+
     phase: GamePhase = GamePhase.LOBBY
     election_tracker: int = 0
     liberal_policies: int = 0
     fascist_policies: int = 0
-    votes: Dict[str, bool] = {}
-    government_history: List[Tuple[str, str]] = []
+    votes: Dict[str, bool] = Field(default_factory=dict)
+    government_history: List[Tuple[str, str]] = Field(default_factory=list)
     presidential_candidate_id: Optional[str] = None
     chancellor_candidate_id: Optional[str] = None
     last_president_id: Optional[str] = None
     last_chancellor_id: Optional[str] = None
     pending_presidential_power: Optional[PresidentialPower] = None
     power_target_id: Optional[str] = None
-    investigated_players: Dict[str, Party] = {}
+    investigated_players: Dict[str, Party] = Field(default_factory=dict)
 
 
 class Game(BaseModel):
@@ -149,6 +207,72 @@ class Game(BaseModel):
     policy_deck: List[PolicyType]
     discard_pile: List[PolicyType]
 
+    # Bumped by mark_dirty() and by field assignments on seated players, so
+    # derived data can be cached per state.
+    _version: _VersionCounter = PrivateAttr(default_factory=_VersionCounter)
+    # Lookup indexes over ``players``, rebuilt on first use after the version
+    # changes, so in-place edits followed by mark_dirty() are picked up.
+    _indexed_version: int = PrivateAttr(default=-1)
+    _player_by_id: Dict[str, Player] = PrivateAttr(default_factory=dict)
+    _alive_players: Dict[str, Player] = PrivateAttr(default_factory=dict)
+    _hitler_player: Optional[Player] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._dirty()
+
+    def _dirty(self) -> None:
+        self._version.value += 1
+
+    def _ensure_indexed(self) -> None:
+        """Rebuild the id -> Player indexes and the Hitler lookup if the game has changed."""
+        counter = self._version
+        if self._indexed_version == counter.value:
+            return
+        players = self.players
+        for p in players:
+            if p._game_version is not counter:
+                p._game_version = counter
+        self._player_by_id = {p.id: p for p in players}
+        self._alive_players = {p.id: p for p in players if p.is_alive}
+        self._hitler_player = next((p for p in players if p.is_hitler()), None)
+        self._indexed_version = counter.value
+
+    def mark_dirty(self) -> None:
+        """
+        Bump the version, invalidating data cached for the previous state.
+
+        Game's own mutators call this already; code that changes game_state
+        or the player/deck lists in place must call it afterwards, which also
+        makes the player indexes rebuild on their next use.
+        """
+        self._dirty()
+
+    @property
+    def players_by_id(self) -> Dict[str, Player]:
+        """Index of all players by ID (read-only; rebuilt after the game changes)."""
+        self._ensure_indexed()
+        return self._player_by_id
+
+    @property
+    def alive_players_by_id(self) -> Dict[str, Player]:
+        """Index of living players by ID, in seat order (read-only; rebuilt after the game changes)."""
+        self._ensure_indexed()
+        return self._alive_players
+
+    @property
+    def alive_count(self) -> int:
+        """Number of living players."""
+        return len(self.alive_players_by_id)
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the game or one of its players changes."""
+        # Seats players added since the last change, so their edits count from now on
+        self._ensure_indexed()
+        return self._version.value
+
     @classmethod
     def create_new_game(cls, player_names: List[str]) -> 'Game':
         """
@@ -165,9 +289,13 @@ class Game(BaseModel):
 
         game_id = "game_" + str(hash("".join(player_names)))  # Simple ID generation
 
-        # Create players with IDs
+        # Create players with IDs. Every field is built here from known-good
+        # values, so skip pydantic validation entirely.
         players = [
-            Player(id=f"player_{i}", name=name, role=Role.LIBERAL, is_human=True)
+            Player.model_construct(
+                id=f"player_{i}", name=name, role=Role.LIBERAL, is_human=True,
+                is_alive=True, investigated_by=None
+            )
             for i, name in enumerate(player_names)
         ]
 
@@ -175,12 +303,26 @@ class Game(BaseModel):
         cls._assign_roles(players)
 
         # Initialize game state
-        game_state = GameState()
+        game_state = GameState.model_construct(
+            phase=GamePhase.LOBBY,
+            election_tracker=0,
+            liberal_policies=0,
+            fascist_policies=0,
+            votes={},
+            government_history=[],
+            presidential_candidate_id=None,
+            chancellor_candidate_id=None,
+            last_president_id=None,
+            last_chancellor_id=None,
+            pending_presidential_power=None,
+            power_target_id=None,
+            investigated_players={}
+        )
 
         # Create and shuffle policy deck
         policy_deck = cls._create_policy_deck()
 
-        return cls(
+        return cls.model_construct(
             game_id=game_id,
             players=players,
             game_state=game_state,
@@ -188,36 +330,72 @@ class Game(BaseModel):
             discard_pile=[]
         )
 
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> 'Game':
+        """
+        Rebuild a game from a dict produced by ``model_dump()``.
+
+        Unlike ``model_validate`` this skips pydantic validation and only
+        normalizes enum values, so it must never be fed external input.
+
+        Args:
+            data: Serialized game, as returned by ``Game.model_dump()``.
+
+        Returns:
+            The reconstructed Game instance.
+        """
+        players = [
+            Player.model_construct(
+                id=p["id"],
+                name=p["name"],
+                role=Role(p["role"]),
+                is_human=p["is_human"],
+                is_alive=p["is_alive"],
+                investigated_by=p["investigated_by"]
+            )
+            for p in data["players"]
+        ]
+
+        state = data["game_state"]
+        power = state["pending_presidential_power"]
+        game_state = GameState.model_construct(
+            phase=GamePhase(state["phase"]),
+            election_tracker=state["election_tracker"],
+            liberal_policies=state["liberal_policies"],
+            fascist_policies=state["fascist_policies"],
+            votes=dict(state["votes"]),
+            government_history=[tuple(gov) for gov in state["government_history"]],
+            presidential_candidate_id=state["presidential_candidate_id"],
+            chancellor_candidate_id=state["chancellor_candidate_id"],
+            last_president_id=state["last_president_id"],
+            last_chancellor_id=state["last_chancellor_id"],
+            pending_presidential_power=PresidentialPower(power) if power is not None else None,
+            power_target_id=state["power_target_id"],
+            investigated_players={
+                pid: Party(party) for pid, party in state["investigated_players"].items()
+            }
+        )
+
+        return cls.model_construct(
+            game_id=data["game_id"],
+            players=players,
+            game_state=game_state,
+            policy_deck=[PolicyType(p) for p in data["policy_deck"]],
+            discard_pile=[PolicyType(p) for p in data["discard_pile"]]
+        )
+
     @staticmethod
     def _assign_roles(players: List[Player]) -> None:
         """Assign roles to players based on player count."""
-        num_players = len(players)
-        roles = []
-
-        if num_players == 5:
-            roles = [Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.FASCIST, Role.HITLER]
-        elif num_players == 6:
-            roles = [Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.FASCIST, Role.HITLER]
-        elif num_players == 7:
-            roles = [Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.FASCIST, Role.FASCIST, Role.HITLER]
-        elif num_players == 8:
-            roles = [Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.FASCIST, Role.FASCIST, Role.HITLER]
-        elif num_players == 9:
-            roles = [Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.FASCIST, Role.FASCIST, Role.FASCIST, Role.HITLER]
-        elif num_players == 10:
-            roles = [Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.LIBERAL, Role.FASCIST, Role.FASCIST, Role.FASCIST, Role.HITLER]
-
-        # Shuffle roles and assign
-        import random
-        random.shuffle(roles)
+        composition = _ROLE_COMPOSITIONS[len(players)]
+        roles = random.sample(composition, len(composition))
         for player, role in zip(players, roles):
             player.role = role
 
     @staticmethod
     def _create_policy_deck() -> List[PolicyType]:
         """Create and shuffle the initial policy deck."""
-        deck = ([PolicyType.LIBERAL] * 6) + ([PolicyType.FASCIST] * 11)
-        import random
+        deck = list(_INITIAL_POLICY_DECK)
         random.shuffle(deck)
         return deck
 
@@ -231,17 +409,49 @@ class Game(BaseModel):
         Returns:
             List of drawn policies.
         """
-        drawn = []
-        for _ in range(count):
+        self._dirty()
+        drawn: List[PolicyType] = []
+        while count:
             if not self.policy_deck:
-                # Reshuffle discard pile
-                self.policy_deck = self.discard_pile.copy()
+                # Reshuffle discard pile: hand the list over instead of copying it
+                self.policy_deck = self.discard_pile
                 self.discard_pile = []
-                import random
                 random.shuffle(self.policy_deck)
-            drawn.append(self.policy_deck.pop())
+            deck = self.policy_deck
+            if not deck:
+                raise IndexError("No policies left to draw")
+            # Take a whole run off the top (the end of the list) at once
+            take = min(count, len(deck))
+            drawn.extend(reversed(deck[-take:]))
+            del deck[-take:]
+            count -= take
         return drawn
 
+    def peek_policies(self, count: int) -> List[PolicyType]:
+        """
+        Look at the next policies to be drawn without drawing them.
+
+        When the deck is short, the discard pile is shuffled in beneath the
+        remaining cards first, so a following draw_policies() returns exactly
+        the peeked policies.
+
+        Args:
+            count: Number of policies to look at.
+
+        Returns:
+            The policies in the order they would be drawn.
+        """
+        deck = self.policy_deck
+        if len(deck) < count and self.discard_pile:
+            reshuffled = self.discard_pile
+            random.shuffle(reshuffled)
+            reshuffled.extend(deck)
+            self.policy_deck = reshuffled
+            self.discard_pile = []
+            deck = reshuffled
+        # The top of the deck is the end of the list
+        return deck[:-count - 1:-1]
+
     def get_eligible_chancellors(self, president_id: str) -> List[Player]:
         """
         Get players eligible to be chancellor for the given president.
@@ -252,12 +462,10 @@ class Game(BaseModel):
         Returns:
             List of eligible players.
         """
-        return [
-            player for player in self.players
-            if player.is_alive and player.id != president_id and
-            player.id != self.game_state.last_president_id and
-            player.id != self.game_state.last_chancellor_id
-        ]
+        game_state = self.game_state
+        forbidden = {president_id, game_state.last_president_id, game_state.last_chancellor_id}
+        # Iterate the alive index rather than a set difference to keep seat order
+        return [player for pid, player in self.alive_players_by_id.items() if pid not in forbidden]
 
     def process_votes(self) -> bool:
         """
@@ -266,8 +474,10 @@ class Game(BaseModel):
         Returns:
             True if the government is formed, False if election fails.
         """
-        yes_votes = sum(1 for vote in self.game_state.votes.values() if vote)
-        total_votes = len(self.game_state.votes)
+        self._dirty()
+        votes = self.game_state.votes
+        yes_votes = sum(votes.values())  # bools sum as ints
+        total_votes = len(votes)
 
         if yes_votes > total_votes / 2:
             # Government formed
@@ -287,12 +497,13 @@ class Game(BaseModel):
 
     def advance_election_tracker(self) -> None:
         """Advance the election tracker and handle chaos if it reaches 3."""
+        self._dirty()
         self.game_state.election_tracker += 1
         if self.game_state.election_tracker >= 3:
             # Chaos: enact top policy
             if self.policy_deck:
                 policy = self.policy_deck.pop()
-                if policy == PolicyType.LIBERAL:
+                if policy is PolicyType.LIBERAL:
                     self.game_state.liberal_policies += 1
                 else:
                     self.game_state.fascist_policies += 1
@@ -306,41 +517,24 @@ class Game(BaseModel):
         Returns:
             The presidential power to execute, or None.
         """
-        fascist_policies = self.game_state.fascist_policies
-        num_players = len([p for p in self.players if p.is_alive])
-
-        if num_players >= 9:
-            if fascist_policies == 1:
-                return PresidentialPower.INVESTIGATE_LOYALTY
-            elif fascist_policies == 2:
-                return PresidentialPower.CALL_SPECIAL_ELECTION
-            elif fascist_policies == 3:
-                return PresidentialPower.POLICY_PEEK
-            elif fascist_policies >= 4:
-                return PresidentialPower.EXECUTION
-        else:  # 5-8 players
-            if fascist_policies == 1:
-                return PresidentialPower.NONE
-            elif fascist_policies == 2:
-                return PresidentialPower.INVESTIGATE_LOYALTY
-            elif fascist_policies == 3:
-                return PresidentialPower.CALL_SPECIAL_ELECTION
-            elif fascist_policies >= 4:
-                return PresidentialPower.EXECUTION
-
-        return PresidentialPower.NONE
+        # Every count from 4 upward grants execution, so clamp into the table
+        fascist_policies = min(self.game_state.fascist_policies, 5)
+        return _POWER_TABLE.get(
+            (self.alive_count >= 9, fascist_policies), PresidentialPower.NONE
+        )
 
     def execute_presidential_power(self) -> None:
         """Execute the pending presidential power."""
+        self._dirty()
         power = self.game_state.pending_presidential_power
         target_id = self.game_state.power_target_id
 
-        if power == PresidentialPower.INVESTIGATE_LOYALTY and target_id:
-            target = next((p for p in self.players if p.id == target_id), None)
+        if power is PresidentialPower.INVESTIGATE_LOYALTY and target_id:
+            target = self.players_by_id.get(target_id)
             if target:
                 self.game_state.investigated_players[target_id] = target.party
                 target.investigated_by = self.game_state.last_president_id
-        elif power == PresidentialPower.EXECUTION and target_id:
+        elif power is PresidentialPower.EXECUTION and target_id:
             self.eliminate_player(target_id)
 
         self.game_state.pending_presidential_power = None
@@ -353,9 +547,11 @@ class Game(BaseModel):
         Args:
             player_id: ID of the player to eliminate.
         """
-        player = next((p for p in self.players if p.id == player_id), None)
+        player = self.players_by_id.get(player_id)
         if player:
             player.is_alive = False
+            # After the change, so the alive index is rebuilt without them
+            self._dirty()
             # Check for win condition (Hitler executed)
             if player.is_hitler():
                 self.game_state.phase = GamePhase.GAME_OVER
@@ -367,17 +563,19 @@ class Game(BaseModel):
         Returns:
             The winning party, or None if the game continues.
         """
-        if self.game_state.liberal_policies >= 5:
+        game_state = self.game_state
+        if game_state.liberal_policies >= 5:
             return Party.LIBERAL
-        if self.game_state.fascist_policies >= 6:
+        fascist_policies = game_state.fascist_policies
+        if fascist_policies >= 6:
             return Party.FASCIST
-        if any(not p.is_alive for p in self.players if p.is_hitler()):
+        self._ensure_indexed()
+        hitler = self._hitler_player
+        if hitler is not None and not hitler.is_alive:
             return Party.LIBERAL
         # Check if Hitler is chancellor after 3 fascist policies
-        if self.game_state.fascist_policies >= 3:
-            last_gov = self.game_state.government_history[-1] if self.game_state.government_history else None
-            if last_gov:
-                chancellor = next((p for p in self.players if p.id == last_gov[1]), None)
-                if chancellor and chancellor.is_hitler():
-                    return Party.FASCIST
+        if fascist_policies >= 3 and game_state.government_history:
+            chancellor = self._player_by_id.get(game_state.government_history[-1][1])
+            if chancellor is not None and chancellor is hitler:
+                return Party.FASCIST
         return None
\ No newline at end of file
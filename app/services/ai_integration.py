@@ -4,6 +4,7 @@ Manages AI players and coordinates their actions with the game engine.
 """
 import asyncio
 import logging
+import random
 from typing import Dict, List, Optional, Any
 
 from .ai_players import AIDecisionManager, AIPlayer, AIPersonality
@@ -15,6 +16,13 @@ from ..models.game_models import Player
 
 logger = logging.getLogger(__name__)
 
+# Bounds (seconds) of the randomized "thinking" delay before each AI action
+AI_ACTION_DELAY_MIN = 0.5
+AI_ACTION_DELAY_MAX = 3.0
+
+# Presidential powers that need a target player
+_TARGETED_POWERS = frozenset({'investigate_loyalty', 'call_special_election', 'execution'})
+
 class AIIntegrationService:
     """Manages AI players and their integration with games."""
 
@@ -22,6 +30,8 @@ class AIIntegrationService:
         self.game_manager = game_manager
         self.ai_decision_manager = None  # Will be set when needed
         self.ai_players: Dict[str, AIPlayer] = {}  # player_id -> AIPlayer
+        self._ai_count_per_game: Dict[str, int] = {}  # game_id -> number of AI players
+        self._ai_game_ids: Dict[str, str] = {}  # player_id -> game_id of each AI player
 
     def _get_ai_decision_manager(self) -> AIDecisionManager:
         """Get or create the AI decision manager."""
@@ -61,6 +71,8 @@ class AIIntegrationService:
                 )
 
                 self.ai_players[player_id] = ai_player
+                self._ai_game_ids[player_id] = game_id
+                self._ai_count_per_game[game_id] = self._ai_count_per_game.get(game_id, 0) + 1
                 logger.info(f"Added AI player {ai_name} ({personality.value}) to game {game_id}")
 
         except Exception as e:
@@ -77,17 +89,26 @@ class AIIntegrationService:
         try:
             game_state = await self.game_manager.get_game_state(game_id)
 
-            # Find AI players whose turn it is
-            for player in game_state.players:
-                if player.id in self.ai_players and not player.is_connected:  # AI players marked as disconnected
-                    ai_player = self.ai_players[player.id]
+            # Select candidate AIs in one pass (AI players are marked as
+            # disconnected; dead players never have actions) so only they
+            # pay for an available-actions round trip
+            ai_players = self.ai_players
+            candidates = [
+                ai_players[player.id] for player in game_state.players
+                if player.is_alive and not player.is_connected and player.id in ai_players
+            ]
 
-                    # Check if it's this AI's turn
-                    available_actions = await self.game_manager.get_available_actions(game_id, player.id)
+            # Find AI players whose turn it is and schedule each one's action
+            # after its own thinking delay, so AIs overlap instead of queueing
+            actions = []
+            for ai_player in candidates:
+                available_actions = await self.game_manager.get_available_actions(game_id, ai_player.player_id)
 
-                    if self._has_available_actions(available_actions):
-                        await self._process_ai_action(game_id, ai_player, available_actions)
-                        await asyncio.sleep(2)  # Realistic delay between AI actions
+                if self._has_available_actions(available_actions):
+                    delay = random.uniform(AI_ACTION_DELAY_MIN, AI_ACTION_DELAY_MAX)
+                    actions.append(self._delayed_ai_action(game_id, ai_player, available_actions, delay))
+
+            await asyncio.gather(*actions, return_exceptions=True)
 
         except Exception as e:
             logger.error(f"Failed to process AI turns for game {game_id}: {e}")
@@ -103,16 +124,21 @@ class AIIntegrationService:
             game_state = await self.game_manager.get_game_state(game_id)
 
             # Randomly have AI players send chat messages
+            sends = []
             for player in game_state.players:
                 if player.id in self.ai_players:
                     ai_player = self.ai_players[player.id]
 
                     # 20% chance for AI to chat on each message
-                    if asyncio.get_event_loop().time() % 5 < 1:  # Simple randomization
+                    if random.random() < 0.2:
                         chat_message = ai_player.generate_chat_message("casual")
                         if chat_message:
-                            await self.game_manager.send_chat_message(game_id, player.id, chat_message)
-                            await asyncio.sleep(1)  # Delay between AI messages
+                            sends.append(self.game_manager.send_chat_message(game_id, player.id, chat_message))
+
+            # Send concurrently rather than one message per second
+            for result in await asyncio.gather(*sends, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"AI chat message failed in game {game_id}: {result}")
 
         except Exception as e:
             logger.error(f"Failed to handle AI chat for game {game_id}: {e}")
@@ -130,7 +156,7 @@ class AIIntegrationService:
                 logger.warning(f"Recovering from AI failure for player {failed_player_id} in game {game_id}")
 
                 # Remove the failed AI player
-                del self.ai_players[failed_player_id]
+                self._forget_ai_player(failed_player_id)
 
                 # Try to replace with a new AI player
                 try:
@@ -148,12 +174,16 @@ class AIIntegrationService:
 
     def _has_available_actions(self, available_actions: Dict[str, Any]) -> bool:
         """Check if there are any available actions for an AI player."""
-        action_fields = [
-            'can_nominate_chancellor', 'can_vote', 'can_discard_policy',
-            'can_enact_policy', 'can_use_power', 'can_veto'
-        ]
+        get = available_actions.get
+        return bool(
+            get('can_nominate_chancellor') or get('can_vote') or get('can_discard_policy')
+            or get('can_enact_policy') or get('can_use_power') or get('can_veto')
+        )
 
-        return any(available_actions.get(field, False) for field in action_fields)
+    async def _delayed_ai_action(self, game_id: str, ai_player: AIPlayer, available_actions: Dict[str, Any], delay: float) -> None:
+        """Wait out an AI's thinking delay, then process its action."""
+        await asyncio.sleep(delay)
+        await self._process_ai_action(game_id, ai_player, available_actions)
 
     async def _process_ai_action(self, game_id: str, ai_player: AIPlayer, available_actions: Dict[str, Any]) -> None:
         """
@@ -166,21 +196,22 @@ class AIIntegrationService:
         """
         try:
             game_state = await self.game_manager.get_game_state(game_id)
+            get = available_actions.get
 
             # Determine action type and execute
-            if available_actions.get('can_nominate_chancellor', False):
+            if get('can_nominate_chancellor', False):
                 await self._ai_nominate_chancellor(game_id, ai_player, game_state)
 
-            elif available_actions.get('can_vote', False):
+            elif get('can_vote', False):
                 await self._ai_vote(game_id, ai_player, game_state)
 
-            elif available_actions.get('can_discard_policy', False):
+            elif get('can_discard_policy', False):
                 await self._ai_discard_policy(game_id, ai_player, available_actions)
 
-            elif available_actions.get('can_enact_policy', False):
+            elif get('can_enact_policy', False):
                 await self._ai_enact_policy(game_id, ai_player, available_actions)
 
-            elif available_actions.get('can_use_power', False):
+            elif get('can_use_power', False):
                 await self._ai_use_power(game_id, ai_player, game_state, available_actions)
 
         except Exception as e:
@@ -190,19 +221,17 @@ class AIIntegrationService:
     async def _ai_nominate_chancellor(self, game_id: str, ai_player: AIPlayer, game_state: Any) -> None:
         """AI nominates a chancellor."""
         try:
+            pid = ai_player.player_id
             # Get eligible players (excluding self and recent office holders)
-            eligible_players = []
-            for player in game_state.players:
-                if player.id != ai_player.player_id and player.is_alive:
-                    # TODO: Check term limits
-                    eligible_players.append(player.id)
+            # TODO: Check term limits
+            eligible_players = [p.id for p in game_state.players if p.is_alive and p.id != pid]
 
             if eligible_players:
                 # AI makes decision
                 decision = ai_player.decide_chancellor_nomination(eligible_players)
                 if decision and decision in eligible_players:
-                    await self.game_manager.nominate_chancellor(game_id, ai_player.player_id, decision)
-                    logger.info(f"AI {ai_player.player_id} nominated {decision}")
+                    await self.game_manager.nominate_chancellor(game_id, pid, decision)
+                    logger.info(f"AI {pid} nominated {decision}")
 
         except Exception as e:
             logger.error(f"AI chancellor nomination failed: {e}")
@@ -211,9 +240,10 @@ class AIIntegrationService:
         """AI submits a vote."""
         try:
             # AI makes voting decision
+            pid = ai_player.player_id
             vote = ai_player.decide_vote(game_state)
-            await self.game_manager.submit_vote(game_id, ai_player.player_id, vote)
-            logger.info(f"AI {ai_player.player_id} voted {'Ja' if vote else 'Nein'}")
+            await self.game_manager.submit_vote(game_id, pid, vote)
+            logger.info(f"AI {pid} voted {'Ja' if vote else 'Nein'}")
 
         except Exception as e:
             logger.error(f"AI voting failed: {e}")
@@ -253,29 +283,37 @@ class AIIntegrationService:
             if power_type:
                 # Determine target based on power type
                 target_id = None
-                if power_type in ['investigate_loyalty', 'call_special_election', 'execution']:
+                pid = ai_player.player_id
+                if power_type in _TARGETED_POWERS:
                     # Select target
-                    alive_players = [p for p in game_state.players if p.is_alive and p.id != ai_player.player_id]
+                    alive_players = [p for p in game_state.players if p.is_alive and p.id != pid]
                     if alive_players:
                         target_id = ai_player.choose_investigation_target(alive_players) if power_type == 'investigate_loyalty' else alive_players[0].id
 
-                await self.game_manager.use_presidential_power(game_id, ai_player.player_id, target_id)
-                logger.info(f"AI {ai_player.player_id} used power {power_type} on {target_id}")
+                await self.game_manager.use_presidential_power(game_id, pid, target_id)
+                logger.info(f"AI {pid} used power {power_type} on {target_id}")
 
         except Exception as e:
             logger.error(f"AI presidential power failed: {e}")
 
     async def get_ai_player_count(self, game_id: str) -> int:
         """Get the number of AI players in a game."""
-        try:
-            players = await self.game_manager.get_players(game_id)
-            ai_count = sum(1 for player in players if player.id in self.ai_players)
-            return ai_count
-        except Exception:
-            return 0
+        return self._ai_count_per_game.get(game_id, 0)
 
     async def remove_ai_player(self, player_id: str) -> None:
         """Remove an AI player."""
         if player_id in self.ai_players:
-            del self.ai_players[player_id]
-            logger.info(f"Removed AI player {player_id}")
\ No newline at end of file
+            self._forget_ai_player(player_id)
+            logger.info(f"Removed AI player {player_id}")
+
+    def _forget_ai_player(self, player_id: str) -> None:
+        """Drop an AI player and update the AI count of the game it was added to."""
+        del self.ai_players[player_id]
+        game_id = self._ai_game_ids.pop(player_id, None)
+        if game_id is None:
+            return
+        remaining = self._ai_count_per_game.get(game_id, 0) - 1
+        if remaining > 0:
+            self._ai_count_per_game[game_id] = remaining
+        else:
+            self._ai_count_per_game.pop(game_id, None)
\ No newline at end of file
@@ -5,9 +5,12 @@ This module contains the core classes and logic for AI players, including their
 decision-making processes, memory, and personalities.
 """
 
+import asyncio
+import operator
 import random
-from enum import StrEnum
-from typing import Any, Dict, List, Optional
+from enum import IntEnum, StrEnum
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 from app.models.game_models import Game, Player, PolicyType, Party, Role
 
@@ -25,8 +28,96 @@ class AIDifficulty(StrEnum):
     EXPERT = "expert"
 
 
+class ActionType(IntEnum):
+    """Decisions an AI player can be asked to make; values index handler tables."""
+    NOMINATE_CHANCELLOR = 0
+    VOTE = 1
+    DISCARD_POLICY = 2
+    ENACT_POLICY = 3
+    INVESTIGATE_LOYALTY = 4
+    EXECUTE_PLAYER = 5
+    CALL_SPECIAL_ELECTION = 6
+
+
+# String action names accepted by make_decision for backward compatibility
+_ACTION_TYPES_BY_NAME: Dict[str, ActionType] = {
+    "nominate_chancellor": ActionType.NOMINATE_CHANCELLOR,
+    "vote": ActionType.VOTE,
+    "discard_policy": ActionType.DISCARD_POLICY,
+    "enact_policy": ActionType.ENACT_POLICY,
+    "investigate_loyalty": ActionType.INVESTIGATE_LOYALTY,
+    "execute_player": ActionType.EXECUTE_PLAYER,
+    "call_special_election": ActionType.CALL_SPECIAL_ELECTION,
+}
+
+
+# Canned chat lines per personality, keyed by context
+_CHAT_RESPONSES: Mapping[AIPersonality, Mapping[str, str]] = MappingProxyType({
+    AIPersonality.CAUTIOUS_CONSERVATIVE: MappingProxyType({
+        "nomination_concern": "I'm not sure about this government...",
+        "policy_suspicion": "That's a lot of fascist policies lately.",
+        "investigation_request": "We should investigate {player}.",
+    }),
+    AIPersonality.BOLD_AGGRESSOR: MappingProxyType({
+        "accusation": "{player} is definitely a fascist!",
+        "demand_action": "We need to execute {player} NOW!",
+        "confidence": "Trust me on this one.",
+    }),
+})
+
+
+# Role -> (comparison, threshold) applied to a government's summed suspicion.
+# Thresholds are doubled (2 * 0.6, 2 * 0.4) so the pair's suspicion is compared
+# without averaging; scaling by two is exact in binary floating point.
+_VOTE_RULES: Mapping[Role, Tuple[Callable[[float, float], bool], float]] = MappingProxyType({
+    # Liberals vote against suspicious governments.
+    Role.LIBERAL: (operator.lt, 1.2),
+    # Fascists vote for suspicious governments.
+    Role.FASCIST: (operator.gt, 0.8),
+    # Hitler votes like a liberal to maintain cover.
+    Role.HITLER: (operator.lt, 1.2),
+})
+# Fascists won't elect Hitler chancellor before this many fascist policies
+HITLER_CHANCELLOR_MIN_FASCIST_POLICIES = 3
+
+# Governments an EXPERT AI looks ahead when nominating a chancellor
+EXPERT_SEARCH_DEPTH = 4
+# Upper bound on transposition table entries kept during one search
+TRANSPOSITION_TABLE_SIZE = 2 ** 16
+
+# Transposition table entry kinds: exact score, or a lower/upper bound left by a cutoff
+_TT_EXACT = 0
+_TT_LOWER = 1
+_TT_UPPER = 2
+
+
+class _SearchState(NamedTuple):
+    """Policy track position explored by the EXPERT lookahead."""
+    liberal_policies: int
+    fascist_policies: int
+    hitler_elected: bool = False
+
+
+class _SearchMove(NamedTuple):
+    """Electing a chancellor, as the searching AI believes it would play out."""
+    player_id: str
+    enacts_fascist: bool
+    is_hitler: bool
+
+
+def encode_hand(policies: List[PolicyType]) -> int:
+    """Packs a policy hand into one int: liberal count in the high nibble, fascist in the low."""
+    fascists = policies.count(PolicyType.FASCIST)
+    return ((len(policies) - fascists) << 4) | fascists
+
+
 class AIMemory:
     """Stores the AI's knowledge about the game."""
+    __slots__ = (
+        "voting_history", "policy_claims", "investigation_results",
+        "suspicious_behaviors", "confirmed_roles",
+    )
+
     def __init__(self):
         self.voting_history: Dict[str, List[bool]] = {}
         self.policy_claims: Dict[str, List[PolicyType]] = {}
@@ -35,25 +126,137 @@ class AIMemory:
         self.confirmed_roles: Dict[str, Role] = {}
 
 
+# (game, game.version, levels) for the most recently analyzed game state
+_baseline_suspicion_cache: Optional[Tuple[Game, int, Dict[str, float]]] = None
+
+
+def _baseline_suspicion(game: Game) -> Dict[str, float]:
+    """
+    Suspicion levels shared by every AI perspective for one game version.
+
+    Nothing perspective-specific feeds the levels yet, so all AIs analyzing the
+    same state share one dict instead of each building its own.
+    """
+    global _baseline_suspicion_cache
+    cached = _baseline_suspicion_cache
+    if cached is not None and cached[0] is game and cached[1] == game.version:
+        return cached[2]
+    # Placeholder implementation
+    levels = {player.id: 0.5 for player in game.players}
+    _baseline_suspicion_cache = (game, game.version, levels)
+    return levels
+
+
 class GameAnalysis:
-    """Provides a comprehensive analysis of the game state."""
+    """
+    Provides a comprehensive analysis of the game state.
+
+    An analysis is built for one game version, so derived results are computed
+    on first use and shared by every decision made against that version.
+    """
     def __init__(self, game: Game, player_perspective: Player):
         self.game = game
         self.player_perspective = player_perspective
+        self._suspicion_levels: Optional[Dict[str, float]] = None
+        self._fellow_fascists: Optional[List[str]] = None
+        self._fellow_fascist_ids: Optional[FrozenSet[str]] = None
+        self._nominatable_fascist_ids: Optional[FrozenSet[str]] = None
+        self._liberal_ids: Optional[FrozenSet[str]] = None
+        self._least_suspicious_first: Optional[List[str]] = None
+        self._most_suspicious_first: Optional[List[str]] = None
 
     def calculate_suspicion_levels(self) -> Dict[str, float]:
-        """Calculates suspicion levels for all players."""
-        # Placeholder implementation
-        return {player.id: 0.5 for player in self.game.players}
+        """Calculates suspicion levels for all players (treat the result as read-only)."""
+        if self._suspicion_levels is None:
+            self._suspicion_levels = _baseline_suspicion(self.game)
+        return self._suspicion_levels
 
     def identify_likely_fascists(self) -> List[str]:
         """Identifies players who are likely to be fascists."""
-        if self.player_perspective.party == Party.FASCIST:
-            return [
-                p.id for p in self.game.players
-                if p.party == Party.FASCIST and p.id != self.player_perspective.id
-            ]
-        return []
+        if self._fellow_fascists is None:
+            self._split_teams()
+        return self._fellow_fascists
+
+    def fellow_fascist_ids(self) -> FrozenSet[str]:
+        """identify_likely_fascists() as a set, for O(1) membership checks."""
+        if self._fellow_fascist_ids is None:
+            self._fellow_fascist_ids = frozenset(self.identify_likely_fascists())
+        return self._fellow_fascist_ids
+
+    def nominatable_fascist_ids(self) -> FrozenSet[str]:
+        """Fellow fascists other than Hitler, i.e. safe chancellor picks for a fascist."""
+        if self._nominatable_fascist_ids is None:
+            self._split_teams()
+        return self._nominatable_fascist_ids
+
+    def least_suspicious(self, candidates: List[Player]) -> str:
+        """
+        Returns the ID of the least suspicious candidate.
+
+        Ties go to the earliest seat. Candidates without a suspicion level
+        rank last; if none have one, the first candidate is returned.
+        """
+        if self._least_suspicious_first is None:
+            self._rank_by_suspicion()
+        return self._first_ranked(self._least_suspicious_first, candidates)
+
+    def most_suspicious(self, candidates: List[Player]) -> str:
+        """Returns the ID of the most suspicious candidate, with the same tie rules."""
+        if self._most_suspicious_first is None:
+            self._rank_by_suspicion()
+        return self._first_ranked(self._most_suspicious_first, candidates)
+
+    def rank_by_suspicion(self, candidates: List[Player], most_suspicious_first: bool = False) -> List[Player]:
+        """Returns the candidates ordered by suspicion, with the same tie rules."""
+        if self._least_suspicious_first is None:
+            self._rank_by_suspicion()
+        ranking = self._most_suspicious_first if most_suspicious_first else self._least_suspicious_first
+        by_id = {p.id: p for p in candidates}
+        ranked = [by_id.pop(pid) for pid in ranking if pid in by_id]
+        ranked.extend(by_id.values())
+        return ranked
+
+    def _rank_by_suspicion(self) -> None:
+        """Sort player IDs by suspicion once, in both directions."""
+        levels = self.calculate_suspicion_levels()
+        # Sort plain tuples (no key function) so both sorts stay in C; negating
+        # the level gives descending suspicion with ascending seat tie-breaks
+        ascending = sorted([(level, seat, pid) for seat, (pid, level) in enumerate(levels.items())])
+        descending = sorted([(-level, seat, pid) for level, seat, pid in ascending])
+        self._least_suspicious_first = [pid for _, _, pid in ascending]
+        self._most_suspicious_first = [pid for _, _, pid in descending]
+
+    @staticmethod
+    def _first_ranked(ranking: List[str], candidates: List[Player]) -> str:
+        wanted = {p.id for p in candidates}
+        for pid in ranking:
+            if pid in wanted:
+                return pid
+        return candidates[0].id
+
+    def liberal_ids(self) -> FrozenSet[str]:
+        """IDs of all liberal players."""
+        if self._liberal_ids is None:
+            self._split_teams()
+        return self._liberal_ids
+
+    def _split_teams(self) -> None:
+        """Build the fellow-fascist list and liberal ID set in one pass over the players."""
+        my_id = self.player_perspective.id
+        i_am_fascist = self.player_perspective.party == Party.FASCIST
+        fellow_fascists: List[str] = []
+        liberal_ids: List[str] = []
+        hitler_id: Optional[str] = None
+        for p in self.game.players:
+            if p.party == Party.LIBERAL:
+                liberal_ids.append(p.id)
+            elif i_am_fascist and p.id != my_id:
+                fellow_fascists.append(p.id)
+                if p.is_hitler():
+                    hitler_id = p.id
+        self._fellow_fascists = fellow_fascists
+        self._liberal_ids = frozenset(liberal_ids)
+        self._nominatable_fascist_ids = frozenset(fellow_fascists).difference((hitler_id,))
 
     def assess_win_probability(self) -> Dict[Party, float]:
         """Assesses the win probability for each party."""
@@ -73,201 +276,357 @@ class GameAnalysis:
 
 class AIPlayer:
     """Base class for all AI players."""
-    def __init__(self, player_id: str, personality: AIPersonality, difficulty: AIDifficulty = AIDifficulty.INTERMEDIATE):
+    def __init__(self, player_id: str, personality: AIPersonality, difficulty: AIDifficulty = AIDifficulty.INTERMEDIATE,
+                 seed: Optional[int] = None):
         self.player_id = player_id
         self.personality = personality
+        # Private RNG: isolates AI randomness from the global generator and
+        # makes an AI reproducible when given a seed
+        self._rng = random.Random(seed)
         self.difficulty = difficulty
         self.memory = AIMemory()
         self.game: Optional[Game] = None
         self.player_perspective: Optional[Player] = None
+        # (game.version, analysis) of the last analyzed state of self.game
+        self._analysis_cache: Optional[Tuple[int, GameAnalysis]] = None
+
+        # Handler(options) tables indexed by ActionType, built once instead of
+        # walking an if/elif chain on every decision
+        self._strategic_handlers: Tuple[Callable[[Dict], Any], ...] = (
+            lambda o: self.decide_chancellor_nomination(o["eligible_players"]),
+            lambda o: self.decide_vote(o["president"], o["chancellor"]),
+            lambda o: self.choose_policy_to_discard(o["policies"], o.get("hand_byte")),
+            lambda o: self.choose_policy_to_enact(o["policies"], o.get("hand_byte")),
+            lambda o: self.choose_investigation_target(o["eligible_players"]),
+            lambda o: self.choose_execution_target(o["eligible_players"]),
+            lambda o: self.choose_special_election_nominee(o["eligible_players"]),
+        )
+        rng = self._rng
+        random_target: Callable[[Dict], Any] = lambda o: rng.choice(o["eligible_players"]).id
+        random_policy: Callable[[Dict], Any] = lambda o: rng.choice(o["policies"])
+        self._random_handlers: Tuple[Callable[[Dict], Any], ...] = (
+            random_target,
+            lambda o: bool(rng.getrandbits(1)),
+            random_policy,
+            random_policy,
+            random_target,
+            random_target,
+            random_target,
+        )
+
+    def attach(self, game: Game) -> None:
+        """Binds the AI to a game and resolves its own player once."""
+        player = game.players_by_id.get(self.player_id)
+        if not player:
+            raise ValueError(f"Player with id {self.player_id} not found in game.")
+        self.game = game
+        self.player_perspective = player
+        self._analysis_cache = None
+
+    @property
+    def analysis(self) -> GameAnalysis:
+        """Analysis of the attached game, rebuilt only when its version changes."""
+        cached = self._analysis_cache
+        game = self.game
+        if game is None:
+            raise RuntimeError(f"AI player {self.player_id} is not attached to a game")
+        if cached is not None and cached[0] == game.version:
+            return cached[1]
+        # The player list may have been replaced since the last version
+        self.attach(game)
+        analysis = GameAnalysis(game, self.player_perspective)
+        self._analysis_cache = (game.version, analysis)
+        return analysis
 
     def analyze_game_state(self, game: Game) -> GameAnalysis:
         """Analyzes the current game state from the AI's perspective."""
-        self.game = game
-        self.player_perspective = next((p for p in game.players if p.id == self.player_id), None)
-        if not self.player_perspective:
-            raise ValueError(f"Player with id {self.player_id} not found in game.")
-        return GameAnalysis(game, self.player_perspective)
+        if game is not self.game:
+            self.attach(game)
+        return self.analysis
+
+    @property
+    def difficulty(self) -> AIDifficulty:
+        return self._difficulty
 
-    def make_decision(self, action_type: str, options: Dict) -> Any:
+    @difficulty.setter
+    def difficulty(self, difficulty: AIDifficulty) -> None:
+        self._difficulty = difficulty
+        # Beginners make a random decision 20% of the time
+        self._random_decision_rate = 0.2 if difficulty == AIDifficulty.BEGINNER else 0.0
+
+    def make_decision(self, action_type: Union[ActionType, str], options: Dict) -> Any:
         """Makes a strategic decision based on the action type and options."""
-        if self.difficulty == AIDifficulty.BEGINNER and random.random() < 0.2: # 20% chance of a random decision
-            if action_type == "nominate_chancellor":
-                return random.choice(options["eligible_players"]).id
-            elif action_type == "vote":
-                return random.choice([True, False])
-            elif action_type == "discard_policy":
-                return random.choice(options["policies"])
-            elif action_type == "enact_policy":
-                return random.choice(options["policies"])
-            elif action_type in ["investigate_loyalty", "execute_player", "call_special_election"]:
-                return random.choice(options["eligible_players"]).id
-
-        if action_type == "nominate_chancellor":
-            return self.decide_chancellor_nomination(options["eligible_players"])
-        elif action_type == "vote":
-            return self.decide_vote(options["president"], options["chancellor"])
-        elif action_type == "discard_policy":
-            return self.choose_policy_to_discard(options["policies"])
-        elif action_type == "enact_policy":
-            return self.choose_policy_to_enact(options["policies"])
-        elif action_type == "investigate_loyalty":
-            return self.choose_investigation_target(options["eligible_players"])
-        elif action_type == "execute_player":
-            return self.choose_execution_target(options["eligible_players"])
-        elif action_type == "call_special_election":
-            return self.choose_special_election_nominee(options["eligible_players"])
-        # Add other action types here
-        return None
+        if action_type.__class__ is not ActionType:
+            action_type = _ACTION_TYPES_BY_NAME.get(action_type)
+            if action_type is None:
+                return None
+
+        threshold = self._random_decision_rate
+        if threshold and self._rng.random() < threshold:
+            return self._random_handlers[action_type](options)
+        return self._strategic_handlers[action_type](options)
 
     def decide_chancellor_nomination(self, eligible_players: List[Player]) -> str:
         """Decides who to nominate as chancellor."""
-        analysis = self.analyze_game_state(self.game)
+        analysis = self.analysis
         my_role = self.player_perspective.role
 
+        if self.difficulty == AIDifficulty.EXPERT:
+            return self._search_nomination(analysis, eligible_players)
+
         if my_role == Role.LIBERAL:
             # Liberal AI: Choose the player with the lowest suspicion level.
-            suspicion_levels = analysis.calculate_suspicion_levels()
-            return min(eligible_players, key=lambda p: suspicion_levels.get(p.id, 1.0)).id
+            return analysis.least_suspicious(eligible_players)
         elif my_role == Role.FASCIST:
             # Fascist AI: Try to nominate another fascist, but not Hitler if it's too early.
-            fellow_fascists = analysis.identify_likely_fascists()
-            eligible_fascists = [p for p in eligible_players if p.id in fellow_fascists and not p.is_hitler()]
+            allies = analysis.nominatable_fascist_ids()
+            eligible_fascists = [p for p in eligible_players if p.id in allies]
             if eligible_fascists:
-                return random.choice(eligible_fascists).id
+                return self._rng.choice(eligible_fascists).id
             # If no other fascists are eligible, nominate a liberal with high suspicion.
-            suspicion_levels = analysis.calculate_suspicion_levels()
-            return max(eligible_players, key=lambda p: suspicion_levels.get(p.id, 0.0)).id
+            return analysis.most_suspicious(eligible_players)
         elif my_role == Role.HITLER:
             # Hitler AI: Act like a liberal. Nominate the least suspicious player.
-            suspicion_levels = analysis.calculate_suspicion_levels()
-            return min(eligible_players, key=lambda p: suspicion_levels.get(p.id, 1.0)).id
+            return analysis.least_suspicious(eligible_players)
 
         # Default to random choice if logic fails
-        return random.choice(eligible_players).id
+        return self._rng.choice(eligible_players).id
+
+    def _search_nomination(self, analysis: GameAnalysis, eligible_players: List[Player]) -> str:
+        """
+        Picks a chancellor with a depth-limited alpha-beta lookahead.
+
+        Each ply elects one government from the same candidate pool, with our
+        team choosing on maximizing plies and the other team on minimizing
+        ones. A candidate is assumed to enact a policy of the party we believe
+        they belong to: known teammates for fascists, suspicion above 0.5
+        otherwise.
+        """
+        fellow_fascists = analysis.fellow_fascist_ids()
+        suspicion = analysis.calculate_suspicion_levels()
+        knows_team = self.player_perspective.role == Role.FASCIST
+
+        # Order by suspicion so the likeliest best move is searched first;
+        # candidates with the same outcome are interchangeable, keep the first
+        ranked = analysis.rank_by_suspicion(eligible_players, most_suspicious_first=self.player_perspective.is_fascist())
+        moves: Dict[Tuple[bool, bool], _SearchMove] = {}
+        for player in ranked:
+            pid = player.id
+            if knows_team:
+                enacts_fascist = pid in fellow_fascists
+                is_hitler = player.is_hitler()
+            else:
+                enacts_fascist = suspicion.get(pid, 0.5) > 0.5
+                is_hitler = False
+            moves.setdefault((enacts_fascist, is_hitler), _SearchMove(pid, enacts_fascist, is_hitler))
+
+        self._search_moves = tuple(moves.values())
+        self._search_analysis = analysis
+        # Entries only hold for this move set, so start every search afresh
+        self._tt: Dict[Tuple[_SearchState, bool], Tuple[int, float, int, Optional[str]]] = {}
+        game_state = self.game.game_state
+        state = _SearchState(game_state.liberal_policies, game_state.fascist_policies)
+        _, action = self._alpha_beta(state, EXPERT_SEARCH_DEPTH, float("-inf"), float("inf"), True)
+        return action or eligible_players[0].id
+
+    def _alpha_beta(self, state: _SearchState, depth: int, alpha: float, beta: float,
+                    maximizing: bool) -> Tuple[float, Optional[str]]:
+        """Alpha-beta search over the moves prepared by _search_nomination."""
+        winner = self._search_winner(state)
+        if winner is not None:
+            # Prefer quicker wins and slower losses
+            score = 1.0 + depth / 100
+            return (score if winner == self.player_perspective.party else -score), None
+        if depth == 0:
+            return self._search_heuristic(state), None
+
+        # The same track position is reached through many move orders
+        key = (state, maximizing)
+        entry = self._tt.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, score, kind, action = entry
+            if kind == _TT_EXACT:
+                return score, action
+            if kind == _TT_LOWER:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score, action
+        alpha_in, beta_in = alpha, beta
+
+        best_action: Optional[str] = None
+        if maximizing:
+            best = float("-inf")
+            for move in self._search_moves:
+                score, _ = self._alpha_beta(self._apply_search_move(state, move), depth - 1, alpha, beta, False)
+                if score > best:
+                    best, best_action = score, move.player_id
+                alpha = max(alpha, best)
+                if alpha >= beta:
+                    break
+        else:
+            best = float("inf")
+            for move in self._search_moves:
+                score, _ = self._alpha_beta(self._apply_search_move(state, move), depth - 1, alpha, beta, True)
+                if score < best:
+                    best, best_action = score, move.player_id
+                beta = min(beta, best)
+                if alpha >= beta:
+                    break
+
+        if best <= alpha_in:
+            kind = _TT_UPPER
+        elif best >= beta_in:
+            kind = _TT_LOWER
+        else:
+            kind = _TT_EXACT
+        # Replace by depth; once full, only deeper results displace old ones
+        if entry is not None or len(self._tt) < TRANSPOSITION_TABLE_SIZE:
+            if entry is None or entry[0] <= depth:
+                self._tt[key] = (depth, best, kind, best_action)
+        return best, best_action
+
+    @staticmethod
+    def _apply_search_move(state: _SearchState, move: _SearchMove) -> _SearchState:
+        # Hitler elected chancellor after three fascist policies ends the game
+        if move.is_hitler and state.fascist_policies >= 3:
+            return state._replace(hitler_elected=True)
+        if move.enacts_fascist:
+            return state._replace(fascist_policies=state.fascist_policies + 1)
+        return state._replace(liberal_policies=state.liberal_policies + 1)
+
+    @staticmethod
+    def _search_winner(state: _SearchState) -> Optional[Party]:
+        if state.liberal_policies >= 5:
+            return Party.LIBERAL
+        if state.fascist_policies >= 6 or state.hitler_elected:
+            return Party.FASCIST
+        return None
 
-    def decide_vote(self, president: Player, chancellor: Player) -> bool:
+    def _search_heuristic(self, state: _SearchState) -> float:
+        """Scores a non-terminal position for our team, in (-1, 1)."""
+        win_probability = self._search_analysis.assess_win_probability()
+        liberal_edge = (win_probability[Party.LIBERAL] - win_probability[Party.FASCIST]
+                        + state.liberal_policies / 5 - state.fascist_policies / 6) / 3
+        return liberal_edge if self.player_perspective.party == Party.LIBERAL else -liberal_edge
+
+    def decide_vote(self, president: Union[Player, str], chancellor: Union[Player, str]) -> bool:
         """Decides whether to vote 'ja' or 'nein' on a government."""
-        analysis = self.analyze_game_state(self.game)
+        analysis = self.analysis
+        if isinstance(president, str):
+            president = self.game.players_by_id[president]
+        if isinstance(chancellor, str):
+            chancellor = self.game.players_by_id[chancellor]
         my_role = self.player_perspective.role
-        suspicion_levels = analysis.calculate_suspicion_levels()
-
-        # Basic suspicion check
-        president_suspicion = suspicion_levels.get(president.id, 0.5)
-        chancellor_suspicion = suspicion_levels.get(chancellor.id, 0.5)
-        government_suspicion = (president_suspicion + chancellor_suspicion) / 2
+        rule = _VOTE_RULES.get(my_role)
+        if rule is None:
+            # Default to random vote if logic fails
+            return bool(self._rng.getrandbits(1))
 
-        if my_role == Role.LIBERAL:
-            # Liberals vote against suspicious governments.
-            return government_suspicion < 0.6
-        elif my_role == Role.FASCIST:
+        if my_role == Role.FASCIST:
             # Fascists vote for their own, unless it exposes Hitler.
-            fellow_fascists = analysis.identify_likely_fascists()
+            fellow_fascists = analysis.fellow_fascist_ids()
             if president.id in fellow_fascists or chancellor.id in fellow_fascists:
-                if chancellor.is_hitler() and self.game.game_state.fascist_policies < 3:
-                    return False  # Don't elect Hitler as chancellor too early
-                return True
-            return government_suspicion > 0.4 # Vote for suspicious governments
-        elif my_role == Role.HITLER:
-            # Hitler votes like a liberal to maintain cover.
-            return government_suspicion < 0.6
-
-        # Default to random vote if logic fails
-        return random.choice([True, False])
+                # Don't elect Hitler as chancellor too early
+                return not (
+                    chancellor.is_hitler()
+                    and self.game.game_state.fascist_policies < HITLER_CHANCELLOR_MIN_FASCIST_POLICIES
+                )
 
-    def choose_policy_to_discard(self, policies: List[PolicyType]) -> PolicyType:
-        """Decides which policy to discard as president."""
-        my_role = self.player_perspective.role
-        if my_role == Role.LIBERAL:
-            # Liberals always discard a fascist policy if they can.
-            if PolicyType.FASCIST in policies:
-                return PolicyType.FASCIST
-        elif my_role in [Role.FASCIST, Role.HITLER]:
+        # Basic suspicion check against the role's threshold.
+        suspicion_levels = analysis.calculate_suspicion_levels()
+        government_suspicion = suspicion_levels.get(president.id, 0.5) + suspicion_levels.get(chancellor.id, 0.5)
+        compare, threshold = rule
+        return compare(government_suspicion, threshold)
+
+    def choose_policy_to_discard(self, policies: List[PolicyType], hand_byte: Optional[int] = None) -> PolicyType:
+        """
+        Decides which policy to discard as president.
+
+        Callers that already know the hand composition can pass it packed by
+        ``encode_hand`` so the hand is not scanned again.
+        """
+        if hand_byte is None:
+            hand_byte = encode_hand(policies)
+        if self.player_perspective.is_fascist():
             # Fascists discard a liberal policy to advance their agenda.
-            if PolicyType.LIBERAL in policies:
+            if hand_byte >> 4:
                 return PolicyType.LIBERAL
+        elif hand_byte & 0xF:
+            # Liberals always discard a fascist policy if they can.
+            return PolicyType.FASCIST
         # Default to discarding the first policy.
         return policies[0]
 
-    def choose_policy_to_enact(self, policies: List[PolicyType]) -> PolicyType:
+    def choose_policy_to_enact(self, policies: List[PolicyType], hand_byte: Optional[int] = None) -> PolicyType:
         """Decides which policy to enact as chancellor."""
-        # For now, enact the first policy given.
+        # For now, enact the first policy given; the hand composition is
+        # accepted for parity with choose_policy_to_discard.
         # More complex logic will be added later (e.g., veto).
         return policies[0]
 
     def choose_investigation_target(self, eligible_players: List[Player]) -> str:
         """Decides which player to investigate."""
-        analysis = self.analyze_game_state(self.game)
+        analysis = self.analysis
         my_role = self.player_perspective.role
-        suspicion_levels = analysis.calculate_suspicion_levels()
 
-        uninvestigated = [p for p in eligible_players if p.id not in self.game.game_state.investigated_players]
+        # investigated_players maps id -> revealed party, so membership is
+        # already a hash probe; bind it once instead of per player
+        already = self.game.game_state.investigated_players
+        uninvestigated = [p for p in eligible_players if p.id not in already]
         if not uninvestigated:
             uninvestigated = eligible_players
 
         if my_role == Role.LIBERAL:
             # Investigate the most suspicious player.
-            return max(uninvestigated, key=lambda p: suspicion_levels.get(p.id, 0.0)).id
+            return analysis.most_suspicious(uninvestigated)
         elif my_role in [Role.FASCIST, Role.HITLER]:
             # Investigate a known liberal to appear trustworthy.
-            liberals = [p for p in uninvestigated if p.party == Party.LIBERAL]
+            liberal_ids = analysis.liberal_ids()
+            liberals = [p for p in uninvestigated if p.id in liberal_ids]
             if liberals:
-                return min(liberals, key=lambda p: suspicion_levels.get(p.id, 1.0)).id
+                return analysis.least_suspicious(liberals)
         
-        return random.choice(eligible_players).id
+        return self._rng.choice(eligible_players).id
 
     def choose_execution_target(self, eligible_players: List[Player]) -> str:
         """Decides which player to execute."""
-        analysis = self.analyze_game_state(self.game)
+        analysis = self.analysis
         my_role = self.player_perspective.role
-        suspicion_levels = analysis.calculate_suspicion_levels()
 
         if my_role == Role.LIBERAL:
             # Execute the most suspicious player.
-            return max(eligible_players, key=lambda p: suspicion_levels.get(p.id, 0.0)).id
+            return analysis.most_suspicious(eligible_players)
         elif my_role in [Role.FASCIST, Role.HITLER]:
             # Execute a known liberal to remove a threat.
-            liberals = [p for p in eligible_players if p.party == Party.LIBERAL]
+            liberal_ids = analysis.liberal_ids()
+            liberals = [p for p in eligible_players if p.id in liberal_ids]
             if liberals:
-                return max(liberals, key=lambda p: suspicion_levels.get(p.id, 0.0)).id
+                return analysis.most_suspicious(liberals)
 
-        return random.choice(eligible_players).id
+        return self._rng.choice(eligible_players).id
 
     def choose_special_election_nominee(self, eligible_players: List[Player]) -> str:
         """Decides who to nominate as president in a special election."""
-        analysis = self.analyze_game_state(self.game)
+        analysis = self.analysis
         my_role = self.player_perspective.role
-        suspicion_levels = analysis.calculate_suspicion_levels()
 
         if my_role == Role.LIBERAL:
             # Nominate the least suspicious player.
-            return min(eligible_players, key=lambda p: suspicion_levels.get(p.id, 1.0)).id
+            return analysis.least_suspicious(eligible_players)
         elif my_role in [Role.FASCIST, Role.HITLER]:
             # Nominate another fascist if possible.
-            fascists = [p for p in eligible_players if p.party == Party.FASCIST]
+            liberal_ids = analysis.liberal_ids()
+            fascists = [p for p in eligible_players if p.id not in liberal_ids]
             if fascists:
-                return random.choice(fascists).id
+                return self._rng.choice(fascists).id
         
-        return random.choice(eligible_players).id
+        return self._rng.choice(eligible_players).id
 
     def generate_chat_message(self, context: str) -> Optional[str]:
         """Generates a natural language chat message."""
-        responses = {
-            AIPersonality.CAUTIOUS_CONSERVATIVE: {
-                "nomination_concern": "I'm not sure about this government...",
-                "policy_suspicion": "That's a lot of fascist policies lately.",
-                "investigation_request": "We should investigate {player}.",
-            },
-            AIPersonality.BOLD_AGGRESSOR: {
-                "accusation": "{player} is definitely a fascist!",
-                "demand_action": "We need to execute {player} NOW!",
-                "confidence": "Trust me on this one.",
-            },
-        }
-
-        if context in responses[self.personality]:
-            return responses[self.personality][context]
-        return None
+        return _CHAT_RESPONSES[self.personality].get(context)
 
     def update_memory(self, event: Dict) -> None:
         """Updates the AI's memory based on a game event."""
@@ -281,19 +640,48 @@ class AIDecisionManager:
         self.game_engine = game_engine
         self.ai_players: Dict[str, AIPlayer] = {}
 
-    def register_ai_player(self, player: Player, personality: AIPersonality):
-        """Creates and registers a new AI player."""
-        self.ai_players[player.id] = AIPlayer(player.id, personality)
+    def register_ai_player(self, player: Player, personality: AIPersonality, game: Optional[Game] = None):
+        """Creates and registers a new AI player, bound to ``game`` when given."""
+        ai_player = AIPlayer(player.id, personality)
+        if game is not None:
+            ai_player.attach(game)
+        self.ai_players[player.id] = ai_player
 
-    async def request_ai_decision(self, player_id: str, action_type: str, options: Dict) -> Any:
+    async def request_ai_decision(self, player_id: str, action_type: Union[ActionType, str], options: Dict) -> Any:
         """Requests a decision from an AI player."""
         ai_player = self.ai_players.get(player_id)
         if not ai_player:
             return None
 
-        # Simulate human-like response times
-        import asyncio
-        delay = random.uniform(2, 5)
-        await asyncio.sleep(delay)
+        # Decide now, then release the answer after a human-like response
+        # time; a timer handle is far lighter than a coroutine parked in sleep()
+        result = ai_player.make_decision(action_type, options)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        handle = loop.call_later(random.uniform(2, 5), future.set_result, result)
+        try:
+            return await future
+        finally:
+            handle.cancel()
+
+    def request_phase_votes(self, president_id: str, chancellor_id: str, voter_ids: Iterable[str]) -> Dict[str, bool]:
+        """
+        Decides every listed AI's vote on one government in a single pass.
+
+        All voters read the same game version, so the shared baseline suspicion
+        is built once for the phase instead of once per awaited request.
+        """
+        ai_players = self.ai_players
+        options = {"president": president_id, "chancellor": chancellor_id}
+        return {
+            pid: ai_players[pid].make_decision(ActionType.VOTE, options)
+            for pid in voter_ids
+            if pid in ai_players
+        }
 
-        return ai_player.make_decision(action_type, options)
\ No newline at end of file
+    def schedule_phase_votes(self, president_id: str, chancellor_id: str, voter_ids: Iterable[str],
+                             submit: Callable[[str, bool], Any]) -> List[asyncio.TimerHandle]:
+        """Decides a vote phase at once, then hands each vote to ``submit`` after a human-like delay."""
+        votes = self.request_phase_votes(president_id, chancellor_id, voter_ids)
+        loop = asyncio.get_running_loop()
+        return [loop.call_later(random.uniform(2, 5), submit, pid, vote) for pid, vote in votes.items()]
@@ -8,17 +8,25 @@ The GameEngine class serves as the central coordinator for all game actions,
 ensuring proper phase transitions, rule enforcement, and state consistency.
 """
 
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Callable, Deque, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 from enum import StrEnum
 import logging
 import asyncio
+import os
+import time
 
 from app.models.game_models import (
     Game, GameState, Player, PolicyType, GamePhase,
     PresidentialPower, Party, Role
 )
-from app.services.ai_players import AIDecisionManager, AIPersonality
+from app.services.ai_players import ActionType, AIDecisionManager, AIPersonality
+
+
+# Most recent events kept per engine; older ones are dropped (or spilled)
+EVENT_HISTORY_CAP = int(os.getenv("SH_EVENT_HISTORY_CAP", "4096"))
 
 
 # Custom Exceptions for Game Engine
@@ -69,6 +77,79 @@ class EventType(StrEnum):
     GAME_OVER = "game_over"
 
 
+# Phase changes the engine may make; anything else is a bug in the caller
+_LEGAL_TRANSITIONS: frozenset = frozenset({
+    (GamePhase.LOBBY, GamePhase.ROLE_REVEAL),
+    (GamePhase.ROLE_REVEAL, GamePhase.ELECTION),
+    (GamePhase.ELECTION, GamePhase.ELECTION),  # failed election, next president
+    (GamePhase.ELECTION, GamePhase.LEGISLATIVE_SESSION),  # government formed, or chaos
+    (GamePhase.LEGISLATIVE_SESSION, GamePhase.PRESIDENTIAL_POWER),
+    (GamePhase.LEGISLATIVE_SESSION, GamePhase.ELECTION),
+    (GamePhase.PRESIDENTIAL_POWER, GamePhase.ELECTION),
+}).union(
+    (phase, GamePhase.GAME_OVER) for phase in GamePhase if phase != GamePhase.GAME_OVER
+)
+
+# Per-phase action and turn rules. Each takes (engine, player_id, president_id,
+# chancellor_id) so the game state is read once by the caller, not per branch.
+PhaseRule = Callable[["GameEngine", str, Optional[str], Optional[str]], object]
+
+# Action offered to the president for each pending presidential power
+_POWER_ACTIONS: Dict[PresidentialPower, str] = {
+    PresidentialPower.INVESTIGATE_LOYALTY: "investigate_loyalty",
+    PresidentialPower.CALL_SPECIAL_ELECTION: "call_special_election",
+    PresidentialPower.POLICY_PEEK: "policy_peek",
+    PresidentialPower.EXECUTION: "execute_player",
+}
+
+
+def _lobby_actions(engine: "GameEngine", player_id: str, pres: Optional[str], chan: Optional[str]) -> List[str]:
+    return ["start_game"] if engine._can_start_game(player_id) else []
+
+
+def _election_actions(engine: "GameEngine", player_id: str, pres: Optional[str], chan: Optional[str]) -> List[str]:
+    return ["nominate_chancellor"] if player_id == pres else ["submit_vote"]
+
+
+def _legislative_actions(engine: "GameEngine", player_id: str, pres: Optional[str], chan: Optional[str]) -> List[str]:
+    if player_id == pres:
+        return ["draw_policies", "discard_policy"]
+    if player_id == chan:
+        return ["enact_policy", "request_veto"]
+    return []
+
+
+def _power_actions(engine: "GameEngine", player_id: str, pres: Optional[str], chan: Optional[str]) -> List[str]:
+    if player_id != pres:
+        return []
+    action = _POWER_ACTIONS.get(engine.game.game_state.pending_presidential_power)
+    return [action] if action else []
+
+
+_PHASE_ACTIONS: Dict[GamePhase, PhaseRule] = {
+    GamePhase.LOBBY: _lobby_actions,
+    GamePhase.ELECTION: _election_actions,
+    GamePhase.LEGISLATIVE_SESSION: _legislative_actions,
+    GamePhase.PRESIDENTIAL_POWER: _power_actions,
+}
+
+_PHASE_TURNS: Dict[GamePhase, PhaseRule] = {
+    GamePhase.ELECTION: lambda engine, player_id, pres, chan: (
+        player_id == pres or player_id not in engine.game.game_state.votes
+    ),
+    GamePhase.LEGISLATIVE_SESSION: lambda engine, player_id, pres, chan: player_id == pres or player_id == chan,
+    GamePhase.PRESIDENTIAL_POWER: lambda engine, player_id, pres, chan: player_id == pres,
+}
+
+
+def _no_actions(engine: "GameEngine", player_id: str, pres: Optional[str], chan: Optional[str]) -> List[str]:
+    return []
+
+
+def _not_turn(engine: "GameEngine", player_id: str, pres: Optional[str], chan: Optional[str]) -> bool:
+    return False
+
+
 class GameEngine:
     """
     Main orchestrator for Secret Hitler gameplay sessions.
@@ -80,15 +161,21 @@ class GameEngine:
     Attributes:
         game: The Game instance being managed
         logger: Logger for game events and debugging
-        event_history: List of game events for debugging
+        event_history: The most recent game events (up to EVENT_HISTORY_CAP)
+            for debugging; timestamps are integer nanoseconds (see format_timestamp)
     """
 
-    def __init__(self, game: Game) -> None:
+    def __init__(self, game: Game, spill_callback: Optional[Callable[[Dict], None]] = None,
+                 history_enabled: bool = True) -> None:
         """
         Initialize the game engine with a game instance.
 
         Args:
             game: The Game instance to manage
+            spill_callback: Called with each event about to be dropped from the
+                full event history, e.g. to persist it elsewhere
+            history_enabled: Whether to keep event_history; pure logic runs
+                (tests, simulations) can turn it off
 
         Raises:
             ValueError: If game is None or invalid
@@ -98,8 +185,18 @@ class GameEngine:
 
         self.game = game
         self.logger = logging.getLogger(__name__)
-        self.event_history: List[Dict] = []
+        self.event_history: Deque[Dict] = deque(maxlen=EVENT_HISTORY_CAP)
+        self._spill_callback = spill_callback
+        self._history_enabled = history_enabled
+        self._subscribers: List[Callable[[Dict], None]] = []
+        # Set inside simulate(): no AI turns are scheduled
+        self._simulating = False
         self.ai_manager = AIDecisionManager(self)
+        # Votes that close the open election; fixed at nomination, since
+        # nobody can be eliminated while a vote is running
+        self._expected_votes: Optional[int] = None
+        # (president_id, game.version, eligible chancellor ids) of the last check
+        self._eligible_chancellor_cache: Optional[Tuple[str, int, FrozenSet[str]]] = None
 
         # Validate initial game state
         if game.game_state.phase != GamePhase.LOBBY:
@@ -113,7 +210,7 @@ class GameEngine:
             if not player.is_human:
                 # Assign a random personality for now
                 personality = random.choice(list(AIPersonality))
-                self.ai_manager.register_ai_player(player, personality)
+                self.ai_manager.register_ai_player(player, personality, self.game)
 
     def start_game(self) -> GameState:
         """
@@ -128,7 +225,10 @@ class GameEngine:
         if self.game.game_state.phase != GamePhase.LOBBY:
             raise InvalidActionError("Game has already started")
 
-        if len([p for p in self.game.players if p.is_alive]) < 5:
+        # Lobby code may have edited the player list in place; refresh the
+        # game's player indexes before anything relies on them
+        self.game.mark_dirty()
+        if self.game.alive_count < 5:
             raise InvalidActionError("Need at least 5 players to start")
 
         # Transition to role reveal phase
@@ -160,56 +260,83 @@ class GameEngine:
         if not self._is_valid_player(player_id):
             return []
 
-        actions = []
-        phase = self.game.game_state.phase
-
-        if phase == GamePhase.LOBBY:
-            if self._can_start_game(player_id):
-                actions.append("start_game")
-
-        elif phase == GamePhase.ELECTION:
-            if self._is_president(player_id):
-                actions.append("nominate_chancellor")
-            else:
-                actions.append("submit_vote")
-
-        elif phase == GamePhase.LEGISLATIVE_SESSION:
-            if self._is_president(player_id):
-                actions.extend(["draw_policies", "discard_policy"])
-            elif self._is_chancellor(player_id):
-                actions.extend(["enact_policy", "request_veto"])
-
-        elif phase == GamePhase.PRESIDENTIAL_POWER:
-            if self._is_president(player_id):
-                power = self.game.game_state.pending_presidential_power
-                if power == PresidentialPower.INVESTIGATE_LOYALTY:
-                    actions.append("investigate_loyalty")
-                elif power == PresidentialPower.CALL_SPECIAL_ELECTION:
-                    actions.append("call_special_election")
-                elif power == PresidentialPower.POLICY_PEEK:
-                    actions.append("policy_peek")
-                elif power == PresidentialPower.EXECUTION:
-                    actions.append("execute_player")
-
-        return actions
+        gs = self.game.game_state
+        rule = _PHASE_ACTIONS.get(gs.phase, _no_actions)
+        return rule(self, player_id, gs.presidential_candidate_id, gs.chancellor_candidate_id)
 
     def is_player_turn(self, player_id: str) -> bool:
         """Check if it's a specific player's turn to act."""
         if not self._is_valid_player(player_id):
             return False
 
-        phase = self.game.game_state.phase
+        gs = self.game.game_state
+        rule = _PHASE_TURNS.get(gs.phase, _not_turn)
+        return rule(self, player_id, gs.presidential_candidate_id, gs.chancellor_candidate_id)
 
-        if phase == GamePhase.ELECTION:
-            return self._is_president(player_id) or player_id not in self.game.game_state.votes
+    def subscribe(self, callback: Callable[[Dict], None]) -> None:
+        """Call ``callback`` synchronously with every event generated from now on."""
+        self._subscribers.append(callback)
 
-        elif phase == GamePhase.LEGISLATIVE_SESSION:
-            return self._is_president(player_id) or self._is_chancellor(player_id)
+    def unsubscribe(self, callback: Callable[[Dict], None]) -> None:
+        """Stop delivering events to a previously subscribed callback."""
+        self._subscribers.remove(callback)
 
-        elif phase == GamePhase.PRESIDENTIAL_POWER:
-            return self._is_president(player_id)
+    @property
+    def state_version(self) -> int:
+        """Version of the game state; increases with every recorded change."""
+        return self.game.version
 
-        return False
+    def get_snapshot(self) -> Dict:
+        """Full dump of the current game, for callers that need more than events."""
+        return self.game.model_dump()
+
+    def restore(self, snapshot: Dict) -> None:
+        """
+        Reset the managed game, in place, to a dump from get_snapshot().
+
+        The Game, its GameState, its lists and every Player that still exists
+        are updated rather than replaced, so references held elsewhere (game
+        manager, AI players) keep seeing the live objects.
+        """
+        restored = Game.from_trusted_dict(snapshot)
+        game = self.game
+        live_players = game.players_by_id
+
+        players = []
+        for saved in restored.players:
+            player = live_players.get(saved.id)
+            if player is None:
+                player = saved
+            else:
+                for name in Player.model_fields:
+                    setattr(player, name, getattr(saved, name))
+            players.append(player)
+        game.players[:] = players
+
+        for name in GameState.model_fields:
+            setattr(game.game_state, name, getattr(restored.game_state, name))
+        game.policy_deck[:] = restored.policy_deck
+        game.discard_pile[:] = restored.discard_pile
+        game.mark_dirty()
+
+    @contextmanager
+    def simulate(self, snapshot: Optional[Dict] = None) -> Iterator[None]:
+        """
+        Explore moves on the live game, then put it back as it was.
+
+        Inside the block events are neither recorded nor delivered and AI turns
+        are not scheduled. Rollouts from the same state can pass one dump from
+        get_snapshot() to avoid dumping the game for each of them.
+        """
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        saved = (self._history_enabled, self._subscribers, self._simulating, self._expected_votes)
+        self._history_enabled, self._subscribers, self._simulating = False, [], True
+        try:
+            yield
+        finally:
+            self.restore(snapshot)
+            self._history_enabled, self._subscribers, self._simulating, self._expected_votes = saved
 
     def is_game_over(self) -> bool:
         """Check if the game has ended."""
@@ -246,6 +373,7 @@ class GameEngine:
         self.game.game_state.presidential_candidate_id = president_id
         self.game.game_state.chancellor_candidate_id = chancellor_id
         self.game.game_state.votes = {}
+        self._expected_votes = self.game.alive_count - 2  # All except president/chancellor
 
         self._generate_event(EventType.CHANCELLOR_NOMINATED, {
             "president_id": president_id,
@@ -286,8 +414,10 @@ class GameEngine:
         })
 
         # Check if all votes are in
-        alive_players = [p for p in self.game.players if p.is_alive]
-        if len(self.game.game_state.votes) >= len(alive_players) - 2:  # All except president/chancellor
+        expected = self._expected_votes
+        if expected is None:
+            expected = self.game.alive_count - 2  # Election opened without nominate_chancellor
+        if len(self.game.game_state.votes) >= expected:
             return self.process_election_results()
 
         return self._create_result("vote_recorded")
@@ -299,6 +429,7 @@ class GameEngine:
         Returns:
             Dictionary with election result and updated game state
         """
+        self._expected_votes = None
         success = self.game.process_votes()
 
         if success:
@@ -401,7 +532,7 @@ class GameEngine:
         if not self._is_valid_target(target_id):
             raise InvalidTargetError("Invalid investigation target")
 
-        target = next(p for p in self.game.players if p.id == target_id)
+        target = self.game.players_by_id[target_id]
         self.game.game_state.investigated_players[target_id] = target.party
         target.investigated_by = self.game.game_state.presidential_candidate_id
 
@@ -453,17 +584,13 @@ class GameEngine:
         """
         self._validate_presidential_power_action(PresidentialPower.POLICY_PEEK)
 
-        policies = self.game.draw_policies(3)
+        policies = self.game.peek_policies(3)
 
         self._generate_event(EventType.PRESIDENTIAL_POWER_EXECUTED, {
             "power": PresidentialPower.POLICY_PEEK.value,
             "policies": [p.value for p in policies]
         })
 
-        # Put policies back (they were just peeked)
-        for policy in reversed(policies):
-            self.game.policy_deck.insert(0, policy)
-
         self._clear_presidential_power()
         return policies
 
@@ -482,7 +609,7 @@ class GameEngine:
         if not self._is_valid_target(target_id):
             raise InvalidTargetError("Invalid execution target")
 
-        target = next(p for p in self.game.players if p.id == target_id)
+        target = self.game.players_by_id[target_id]
         was_hitler = target.is_hitler()
 
         self.game.eliminate_player(target_id)
@@ -505,26 +632,31 @@ class GameEngine:
 
     def _validate_action(self, player_id: str, expected_phase: GamePhase) -> None:
         """Validate that an action can be performed."""
-        if self.is_game_over():
+        # Phases are always GamePhase members (the models coerce them), so
+        # identity comparison is safe and skips StrEnum's string __eq__
+        phase = self.game.game_state.phase
+        if phase is GamePhase.GAME_OVER:
             raise GameOverError("Game is already over")
 
-        if self.game.game_state.phase != expected_phase:
-            raise WrongPhaseError(f"Expected {expected_phase.value}, got {self.game.game_state.phase.value}")
+        if phase is not expected_phase:
+            raise WrongPhaseError(f"Expected {expected_phase.value}, got {phase.value}")
 
-        if not self._is_valid_player(player_id):
+        player = self.game.players_by_id.get(player_id)
+        if player is None or not player.is_alive:
             raise InvalidTargetError("Invalid player")
 
     def _validate_presidential_power_action(self, expected_power: PresidentialPower) -> None:
         """Validate presidential power execution."""
-        president_id = self.game.game_state.presidential_candidate_id
-        self._validate_action(president_id, GamePhase.PRESIDENTIAL_POWER)
+        gs = self.game.game_state
+        self._validate_action(gs.presidential_candidate_id, GamePhase.PRESIDENTIAL_POWER)
 
-        if self.game.game_state.pending_presidential_power != expected_power:
+        if gs.pending_presidential_power is not expected_power:
             raise InvalidActionError(f"Expected {expected_power.value} power")
 
     def _is_valid_player(self, player_id: str) -> bool:
         """Check if player ID is valid and player is alive."""
-        return any(p.id == player_id and p.is_alive for p in self.game.players)
+        player = self.game.players_by_id.get(player_id)
+        return player is not None and player.is_alive
 
     def _is_valid_target(self, target_id: str) -> bool:
         """Check if target player is valid for actions."""
@@ -549,12 +681,25 @@ class GameEngine:
         if president_id == chancellor_id:
             return False
 
-        eligible = self.game.get_eligible_chancellors(president_id)
-        return any(p.id == chancellor_id for p in eligible)
+        version = self.game.version
+        cached = self._eligible_chancellor_cache
+        if cached is not None and cached[0] == president_id and cached[1] == version:
+            eligible_ids = cached[2]
+        else:
+            eligible_ids = frozenset(p.id for p in self.game.get_eligible_chancellors(president_id))
+            self._eligible_chancellor_cache = (president_id, version, eligible_ids)
+        return chancellor_id in eligible_ids
 
     def _transition_to_phase(self, new_phase: GamePhase) -> None:
-        """Transition to a new game phase."""
+        """
+        Transition to a new game phase.
+
+        Raises:
+            WrongPhaseError: If the game cannot move from its current phase to new_phase
+        """
         old_phase = self.game.game_state.phase
+        if (old_phase, new_phase) not in _LEGAL_TRANSITIONS:
+            raise WrongPhaseError(f"Cannot move from {old_phase.value} to {new_phase.value}")
         self.game.game_state.phase = new_phase
 
         self._generate_event(EventType.PHASE_CHANGED, {
@@ -565,7 +710,7 @@ class GameEngine:
         self.logger.info(f"Phase transition: {old_phase.value} -> {new_phase.value}")
 
         # If the new phase requires an AI decision, request it.
-        if new_phase == GamePhase.ELECTION:
+        if new_phase == GamePhase.ELECTION and not self._simulating:
             president_id = self.game.game_state.presidential_candidate_id
             if president_id in self.ai_manager.ai_players:
                 asyncio.create_task(self.handle_ai_nomination(president_id))
@@ -628,20 +773,42 @@ class GameEngine:
         """Clear the current presidential power."""
         self.game.game_state.pending_presidential_power = None
         self.game.game_state.power_target_id = None
+        self.game.mark_dirty()
 
     def _generate_event(self, event_type: EventType, data: Dict) -> None:
-        """Generate and store a game event."""
+        """
+        Generate and store a game event.
+
+        Events record the state version they produced rather than a full dump
+        of the game; use get_snapshot() when the whole state is needed.
+        """
+        self.game.mark_dirty()
+        if not self._history_enabled and not self._subscribers:
+            return  # Nobody would ever see the event
+
         event = {
             "event_type": event_type.value,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "game_id": self.game.game_id,
             "data": data,
-            "game_state": self.game.model_dump()
+            "state_version": self.game.version
         }
-        self.event_history.append(event)
+        if self._history_enabled:
+            history = self.event_history
+            if self._spill_callback is not None and len(history) == history.maxlen:
+                self._spill_callback(history[0])
+            history.append(event)
+        for callback in self._subscribers:
+            callback(event)
+
+    @staticmethod
+    def format_timestamp(timestamp_ns: int) -> str:
+        """ISO 8601 form of an event's ``timestamp_ns``, for when it leaves the engine."""
+        return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
 
     def _create_result(self, status: str, data: Optional[Dict] = None) -> Dict:
         """Create a standardized result dictionary."""
+        self.game.mark_dirty()
         return {
             "status": status,
             "game_state": self.game.game_state.model_dump(),
@@ -654,19 +821,29 @@ class GameEngine:
         eligible_players = self.game.get_eligible_chancellors(president_id)
         options = {"eligible_players": eligible_players}
         chancellor_id = await self.ai_manager.request_ai_decision(
-            president_id, "nominate_chancellor", options
+            president_id, ActionType.NOMINATE_CHANCELLOR, options
         )
         self.nominate_chancellor(president_id, chancellor_id)
 
-        # After nomination, all other AIs should vote.
-        for player in self.game.players:
-            if player.id in self.ai_manager.ai_players and player.id != president_id:
-                asyncio.create_task(self.handle_ai_vote(player.id))
+        # After nomination, all other living AIs vote; decide them as one batch
+        ai_players = self.ai_manager.ai_players
+        voter_ids = [
+            pid for pid in self.game.alive_players_by_id
+            if pid in ai_players and pid != president_id and pid != chancellor_id
+        ]
+        self.ai_manager.schedule_phase_votes(president_id, chancellor_id, voter_ids, self._submit_ai_vote)
+
+    def _submit_ai_vote(self, player_id: str, vote: bool) -> None:
+        """Submits a delayed AI vote, tolerating a phase that has moved on."""
+        try:
+            self.submit_vote(player_id, vote)
+        except GameEngineError as e:
+            self.logger.warning(f"Dropped AI vote from {player_id}: {e}")
 
     async def handle_ai_vote(self, player_id: str):
-        """Handles the voting process for an AI player."""
-        president = next(p for p in self.game.players if p.id == self.game.game_state.presidential_candidate_id)
-        chancellor = next(p for p in self.game.players if p.id == self.game.game_state.chancellor_candidate_id)
-        options = {"president": president, "chancellor": chancellor}
-        vote = await self.ai_manager.request_ai_decision(player_id, "vote", options)
-        self.submit_vote(player_id, vote)
\ No newline at end of file
+        """Handles the voting process for a single AI player."""
+        # AI players resolve the government from its ids themselves
+        gs = self.game.game_state
+        options = {"president": gs.presidential_candidate_id, "chancellor": gs.chancellor_candidate_id}
+        vote = await self.ai_manager.request_ai_decision(player_id, ActionType.VOTE, options)
+        self._submit_ai_vote(player_id, vote)
\ No newline at end of file
@@ -4,7 +4,7 @@ Handles game lifecycle, player management, and action processing.
 """
 import asyncio
 import uuid
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import logging
 
@@ -22,6 +22,20 @@ from ..api.models import (
 
 logger = logging.getLogger(__name__)
 
+class GameNotFoundError(ValueError):
+    """Raised when a game ID does not refer to an active game."""
+    pass
+
+def _board_state(state: GameState) -> Dict[str, Any]:
+    """Board counters of a game as a BoardStateResponse-shaped dict."""
+    return {
+        "liberal_policies": state.liberal_policies,
+        "fascist_policies": state.fascist_policies,
+        "election_tracker": state.election_tracker,
+        "failed_elections": state.election_tracker,
+        "veto_power_available": state.fascist_policies >= 5
+    }
+
 class GameManager:
     """Manages multiple concurrent games and their lifecycles."""
 
@@ -29,6 +43,8 @@ class GameManager:
         self.websocket_manager = websocket_manager
         self.active_games: Dict[str, Dict[str, Any]] = {}
         self.player_sessions: Dict[str, str] = {}  # player_id -> game_id
+        self._state_cache: Dict[str, Tuple[Any, bytes]] = {}  # game_id -> (version, state JSON)
+        self._read_cache: Dict[str, Dict[str, Tuple[Any, Any]]] = {}  # game_id -> {kind: (version, value)}
         self.game_cleanup_task: Optional[asyncio.Task] = None
 
     def start_cleanup_task(self) -> None:
@@ -36,6 +52,11 @@ class GameManager:
         if self.game_cleanup_task is None or self.game_cleanup_task.done():
             self.game_cleanup_task = asyncio.create_task(self._cleanup_inactive_games())
 
+    def _mark_updated(self, game_context: Dict[str, Any]) -> None:
+        """Record activity on a game and invalidate its cached state snapshot."""
+        game_context["last_activity"] = datetime.now()
+        game_context["state_version"] += 1
+
     async def broadcast_game_update(self, game_id: str, event_type: str, event_data: Dict[str, Any]) -> None:
         """Broadcast a game update to all connected players."""
         if not self.websocket_manager:
@@ -84,7 +105,8 @@ class GameManager:
             "players": {game.players[0].id: game.players[0]},
             "created_at": datetime.now(),
             "last_activity": datetime.now(),
-            "status": GameStatus.WAITING
+            "status": GameStatus.WAITING,
+            "state_version": 0
         }
 
         self.active_games[game_id] = game_context
@@ -96,7 +118,7 @@ class GameManager:
     async def join_game(self, game_id: str, player_name: str) -> Dict[str, Any]:
         """Join an existing game."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
 
@@ -113,9 +135,11 @@ class GameManager:
 
         # Add player to game
         player = Player(id=str(uuid.uuid4()), name=player_name, is_human=True)
-        game_context["game"].players.append(player)
+        game = game_context["game"]
+        game.players.append(player)
+        game.mark_dirty()  # The list was edited in place
         game_context["players"][player.id] = player
-        game_context["last_activity"] = datetime.now()
+        self._mark_updated(game_context)
         self.player_sessions[player.id] = game_id
 
         logger.info(f"Player {player_name} joined game {game_id}")
@@ -128,7 +152,7 @@ class GameManager:
     async def start_game(self, game_id: str) -> Dict[str, Any]:
         """Start a game when ready."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
 
@@ -142,7 +166,7 @@ class GameManager:
         # Start the game
         game_context["engine"].start_game()
         game_context["status"] = GameStatus.IN_PROGRESS
-        game_context["last_activity"] = datetime.now()
+        self._mark_updated(game_context)
 
         logger.info(f"Started game {game_id} with {player_count} players")
         return {
@@ -154,7 +178,7 @@ class GameManager:
     async def leave_game(self, game_id: str, player_id: str) -> None:
         """Remove a player from a game."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
 
@@ -163,12 +187,14 @@ class GameManager:
 
         # Remove player
         player = game_context["players"].pop(player_id)
-        game_context["game"].players.remove(player)
+        game = game_context["game"]
+        game.players.remove(player)
+        game.mark_dirty()  # The list was edited in place
 
         if player_id in self.player_sessions:
             del self.player_sessions[player_id]
 
-        game_context["last_activity"] = datetime.now()
+        self._mark_updated(game_context)
 
         # End game if too few players remain
         remaining_players = len(game_context["players"])
@@ -181,10 +207,12 @@ class GameManager:
     async def get_game_state(self, game_id: str) -> GameStateResponse:
         """Get the current state of a game."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
-        game = game_context["game"]
+        state = game_context["game"].game_state
+        president_id = state.presidential_candidate_id
+        chancellor_id = state.chancellor_candidate_id
 
         # Convert to API response format
         players = [
@@ -193,50 +221,92 @@ class GameManager:
                 name=p.name,
                 is_alive=p.is_alive,
                 role=p.role if p.role else None,
-                is_president=(game.current_president == p.id),
-                is_chancellor=(game.current_chancellor == p.id),
+                is_president=(president_id == p.id),
+                is_chancellor=(chancellor_id == p.id),
                 is_connected=True  # TODO: Implement connection tracking
             )
-            for p in game.players
+            for p in game_context["game"].players
         ]
 
-        board = BoardStateResponse(
-            liberal_policies=game.liberal_policies_enacted,
-            fascist_policies=game.fascist_policies_enacted,
-            election_tracker=game.election_tracker,
-            failed_elections=game.failed_elections,
-            veto_power_available=game.can_veto()
-        )
-
-        winner = None
-        if game.winner:
-            winner = game.winner.value
+        winner = game_context["engine"].get_winner()
 
         return GameStateResponse(
             id=game_id,
             status=game_context["status"],
-            phase=GamePhase(game.current_phase.value),
+            phase=GamePhase(state.phase.value),
             players=players,
-            board=board,
-            current_president=game.current_president,
-            current_chancellor=game.current_chancellor,
-            winner=winner
+            board=BoardStateResponse(**_board_state(state)),
+            current_president=president_id,
+            current_chancellor=chancellor_id,
+            winner=winner.value if winner else None
         )
 
+    def _state_version(self, game_context: Dict[str, Any]) -> Tuple[int, int]:
+        """Version of a game's observable state; changes whenever the game does."""
+        # Engine-driven AI moves bypass _mark_updated but always bump the engine's version
+        return game_context["state_version"], game_context["engine"].state_version
+
+    def _cached_read(self, game_id: str, kind: str, build: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Serve a read from the cache, rebuilding it only when the game has changed."""
+        if game_id not in self.active_games:
+            raise GameNotFoundError("Game not found")
+
+        game_context = self.active_games[game_id]
+        version = self._state_version(game_context)
+
+        game_cache = self._read_cache.setdefault(game_id, {})
+        cached = game_cache.get(kind)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        value = build(game_context)
+        game_cache[kind] = (version, value)
+        return value
+
+    def get_state_etag(self, game_id: str) -> str:
+        """Weak ETag for the current state of a game, for conditional GETs."""
+        if game_id not in self.active_games:
+            raise GameNotFoundError("Game not found")
+
+        version, engine_version = self._state_version(self.active_games[game_id])
+        return f'W/"{game_id}:{version}.{engine_version}"'
+
+    async def get_game_state_json(self, game_id: str) -> bytes:
+        """
+        Get the current state of a game as JSON bytes.
+
+        The encoded state is cached per game and reused until the game changes.
+        """
+        if game_id not in self.active_games:
+            raise GameNotFoundError("Game not found")
+
+        version = self._state_version(self.active_games[game_id])
+
+        cached = self._state_cache.get(game_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        game_state = await self.get_game_state(game_id)
+        payload = game_state.model_dump_json().encode()
+        self._state_cache[game_id] = (version, payload)
+        return payload
+
     async def get_players(self, game_id: str) -> List[PlayerResponse]:
         """Get all players in a game."""
         game_state = await self.get_game_state(game_id)
         return game_state.players
 
-    async def get_board_state(self, game_id: str) -> BoardStateResponse:
-        """Get the current board state."""
-        game_state = await self.get_game_state(game_id)
-        return game_state.board
+    async def get_board_state(self, game_id: str) -> Dict[str, Any]:
+        """Get the current board state as a BoardStateResponse-shaped dict."""
+        def build(game_context: Dict[str, Any]) -> Dict[str, Any]:
+            return _board_state(game_context["game"].game_state)
+
+        return self._cached_read(game_id, "board", build)
 
     async def get_game_history(self, game_id: str, limit: int = 50) -> List[GameHistoryEntry]:
         """Get game action history."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         # TODO: Implement proper history tracking
         # For now, return empty list
@@ -245,7 +315,7 @@ class GameManager:
     async def get_available_actions(self, game_id: str, player_id: str) -> AvailableActionsResponse:
         """Get available actions for a player."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
         engine = game_context["engine"]
@@ -267,41 +337,42 @@ class GameManager:
 
     async def get_current_phase(self, game_id: str) -> Dict[str, Any]:
         """Get current game phase information."""
-        if game_id not in self.active_games:
-            raise ValueError("Game not found")
-
-        game_context = self.active_games[game_id]
-        engine = game_context["engine"]
+        def build(game_context: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "phase": game_context["engine"].get_current_phase(),
+                "phase_data": {}  # TODO: Add phase-specific data
+            }
 
-        return {
-            "phase": engine.get_current_phase(),
-            "phase_data": {}  # TODO: Add phase-specific data
-        }
+        return self._cached_read(game_id, "phase", build)
 
     async def get_current_turn(self, game_id: str) -> Dict[str, Any]:
         """Get whose turn it currently is."""
-        if game_id not in self.active_games:
-            raise ValueError("Game not found")
-
-        game_context = self.active_games[game_id]
-        engine = game_context["engine"]
+        def build(game_context: Dict[str, Any]) -> Dict[str, Any]:
+            engine = game_context["engine"]
+            game = game_context["game"]
+            return {
+                # The president drives every phase; other players only act while voting
+                # or, as chancellor, in the legislative session
+                "current_player": game.game_state.presidential_candidate_id,
+                "is_player_turn": {
+                    player_id: engine.is_player_turn(player_id)
+                    for player_id in game.alive_players_by_id
+                }
+            }
 
-        return {
-            "current_player": engine.get_current_player(),
-            "is_player_turn": engine.is_player_turn
-        }
+        return self._cached_read(game_id, "turn", build)
 
     # Action methods - these delegate to the GameEngine
     async def nominate_chancellor(self, game_id: str, president_id: str, chancellor_id: str) -> Dict[str, Any]:
         """Nominate a chancellor."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
         engine = game_context["engine"]
 
         result = engine.nominate_chancellor(president_id, chancellor_id)
-        game_context["last_activity"] = datetime.now()
+        self._mark_updated(game_context)
 
         # Broadcast the nomination
         await self.broadcast_player_action(game_id, president_id, "nominate_chancellor", {
@@ -314,46 +385,46 @@ class GameManager:
     async def submit_vote(self, game_id: str, player_id: str, vote: bool) -> Dict[str, Any]:
         """Submit an election vote."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
         engine = game_context["engine"]
 
         result = engine.submit_vote(player_id, vote)
-        game_context["last_activity"] = datetime.now()
+        self._mark_updated(game_context)
 
         return result
 
     async def discard_policy(self, game_id: str, player_id: str, policy: PolicyType) -> Dict[str, Any]:
         """Discard a policy as president."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
         engine = game_context["engine"]
 
         result = engine.president_discard_policy(policy)
-        game_context["last_activity"] = datetime.now()
+        self._mark_updated(game_context)
 
         return result
 
     async def enact_policy(self, game_id: str, player_id: str, policy: PolicyType) -> Dict[str, Any]:
         """Enact a policy as chancellor."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
         engine = game_context["engine"]
 
         result = engine.chancellor_enact_policy(policy)
-        game_context["last_activity"] = datetime.now()
+        self._mark_updated(game_context)
 
         return result
 
     async def use_presidential_power(self, game_id: str, player_id: str, target_id: Optional[str]) -> Dict[str, Any]:
         """Use a presidential power."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
         engine = game_context["engine"]
@@ -361,14 +432,14 @@ class GameManager:
         # Determine which power to use based on current game state
         # TODO: Implement power selection logic
         result = {"power_used": "investigate_loyalty", "target": target_id}
-        game_context["last_activity"] = datetime.now()
+        self._mark_updated(game_context)
 
         return result
 
     async def send_chat_message(self, game_id: str, player_id: str, message: str) -> Dict[str, Any]:
         """Send a chat message."""
         if game_id not in self.active_games:
-            raise ValueError("Game not found")
+            raise GameNotFoundError("Game not found")
 
         game_context = self.active_games[game_id]
 
@@ -422,4 +493,7 @@ class GameManager:
 
             # Remove game
             del self.active_games[game_id]
+            self._state_cache.pop(game_id, None)
+            self._read_cache.pop(game_id, None)
+
             logger.info(f"Cleaned up game {game_id}")
\ No newline at end of file
@@ -4,9 +4,12 @@ Integration tests for the AI player system with the GameEngine.
 
 import unittest
 import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from app.services.game_engine import GameEngine
 from app.models.game_models import Game, Player, Role, GamePhase
 from app.services.ai_players import AIPersonality
+from app.services.ai_integration import AIIntegrationService
 
 
 class TestAIIntegration(unittest.TestCase):
@@ -57,5 +60,30 @@ class TestAIIntegration(unittest.TestCase):
         self.assertIsNotNone(engine.get_winner())
 
 
+
+class TestAIIntegrationService(unittest.TestCase):
+    """Tests for AI player bookkeeping in the AIIntegrationService."""
+
+    def test_remove_ai_player_updates_its_own_game(self):
+        """Test that removing an AI decrements the count of the game it joined."""
+        game_manager = AsyncMock()
+        game_manager.get_game_state.return_value = SimpleNamespace(players=[object()] * 3)
+        joined = iter(["ai_1", "ai_2", "ai_3"])
+        game_manager.join_game.side_effect = lambda game_id, name: {"player_id": next(joined)}
+        service = AIIntegrationService(game_manager)
+
+        async def run_test():
+            await service.fill_with_ai_players("game_a", target_player_count=5)
+            await service.fill_with_ai_players("game_b", target_player_count=4)
+            self.assertEqual(await service.get_ai_player_count("game_a"), 2)
+            self.assertEqual(await service.get_ai_player_count("game_b"), 1)
+
+            await service.remove_ai_player("ai_3")
+            self.assertEqual(await service.get_ai_player_count("game_a"), 2)
+            self.assertEqual(await service.get_ai_player_count("game_b"), 0)
+            self.assertNotIn("ai_3", service.ai_players)
+
+        asyncio.run(run_test())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -3,7 +3,7 @@ Unit tests for the AI player system.
 """
 
 import unittest
-from app.services.ai_players import AIPlayer, AIPersonality, GameAnalysis, AIMemory
+from app.services.ai_players import AIPlayer, AIPersonality, AIDifficulty, AIDecisionManager, GameAnalysis, AIMemory, encode_hand
 from app.models.game_models import Game, Player, Role, Party
 
 
@@ -33,6 +33,70 @@ class TestAIFramework(unittest.TestCase):
         self.assertEqual(analysis.game, self.game)
         self.assertEqual(analysis.player_perspective, self.ai_player_model)
 
+    def test_game_analysis_follows_direct_player_edits(self):
+        """Test that changing a player's fields directly invalidates the cached analysis."""
+        analysis = self.ai_player.analyze_game_state(self.game)
+        self.game.players[1].role = Role.FASCIST
+        self.assertIsNot(self.ai_player.analyze_game_state(self.game), analysis)
+
+    def test_decision_without_game_raises(self):
+        """Test that deciding before the AI is attached to a game fails clearly."""
+        with self.assertRaisesRegex(RuntimeError, "not attached to a game"):
+            self.ai_player.decide_vote(self.game.players[1], self.game.players[2])
+
+    def test_game_analysis_cached_per_version(self):
+        """Test that the analysis is reused until the game changes."""
+        analysis = self.ai_player.analyze_game_state(self.game)
+        self.assertIs(self.ai_player.analyze_game_state(self.game), analysis)
+
+        self.game.mark_dirty()
+        self.assertIsNot(self.ai_player.analyze_game_state(self.game), analysis)
+
+    def test_registered_ai_is_bound_to_game(self):
+        """Test that registering with a game resolves the AI's own player up front."""
+        manager = AIDecisionManager()
+        manager.register_ai_player(self.ai_player_model, AIPersonality.BOLD_AGGRESSOR, self.game)
+        ai_player = manager.ai_players[self.ai_player_model.id]
+        self.assertIs(ai_player.game, self.game)
+        self.assertIs(ai_player.player_perspective, self.ai_player_model)
+        self.assertIs(ai_player.analysis, ai_player.analysis)
+
+    def test_request_phase_votes(self):
+        """Test that a vote phase is decided for every listed AI in one call."""
+        manager = AIDecisionManager()
+        for player in self.game.players:
+            manager.register_ai_player(player, AIPersonality.CAUTIOUS_CONSERVATIVE, self.game)
+        president, chancellor = self.game.players[0].id, self.game.players[1].id
+        voter_ids = [p.id for p in self.game.players[2:]]
+        votes = manager.request_phase_votes(president, chancellor, voter_ids + ["unknown"])
+        self.assertEqual(list(votes), voter_ids)
+        self.assertTrue(all(isinstance(v, bool) for v in votes.values()))
+
+    def test_suspicion_ranking(self):
+        """Test least/most suspicious picks, with ties going to the earliest seat."""
+        analysis = self.ai_player.analyze_game_state(self.game)
+        players = self.game.players
+        analysis._suspicion_levels = {p.id: 0.5 for p in players}
+        analysis._suspicion_levels[players[3].id] = 0.9
+        analysis._suspicion_levels[players[4].id] = 0.1
+
+        self.assertEqual(analysis.most_suspicious(players[1:]), players[3].id)
+        self.assertEqual(analysis.least_suspicious(players[1:]), players[4].id)
+        self.assertEqual(analysis.least_suspicious(players[1:3]), players[1].id)
+
+    def test_expert_liberal_nomination_avoids_suspected_fascist(self):
+        """Test that the EXPERT lookahead does not hand a suspect the chancellorship."""
+        self.ai_player.difficulty = AIDifficulty.EXPERT
+        self.ai_player_model.role = Role.LIBERAL
+        analysis = self.ai_player.analyze_game_state(self.game)
+        suspect = self.game.players[1]
+        analysis._suspicion_levels = {p.id: 0.3 for p in self.game.players}
+        analysis._suspicion_levels[suspect.id] = 0.9
+
+        eligible_players = self.game.players[1:]
+        nomination = self.ai_player.make_decision("nominate_chancellor", {"eligible_players": eligible_players})
+        self.assertEqual(nomination, self.game.players[2].id)
+
     def test_placeholder_methods(self):
         """Test that the placeholder methods run without errors."""
         analysis = self.ai_player.analyze_game_state(self.game)
@@ -143,6 +207,17 @@ class TestAIFramework(unittest.TestCase):
         # Should nominate the least suspicious player (mocked as the first player)
         self.assertEqual(nominee, eligible_players[0].id)
 
+    def test_discard_with_packed_hand(self):
+        """A packed hand is honored without rescanning the policy list."""
+        from app.models.game_models import PolicyType
+        self.ai_player_model.role = Role.LIBERAL
+        self.ai_player.analyze_game_state(self.game)
+        policies = [PolicyType.LIBERAL, PolicyType.FASCIST, PolicyType.LIBERAL]
+        hand_byte = encode_hand(policies)
+        self.assertEqual(hand_byte, (2 << 4) | 1)
+        discarded = self.ai_player.make_decision("discard_policy", {"policies": policies, "hand_byte": hand_byte})
+        self.assertEqual(discarded, PolicyType.FASCIST)
+
     def test_generate_chat_message(self):
         """Test the generate_chat_message method."""
         self.ai_player.personality = AIPersonality.BOLD_AGGRESSOR
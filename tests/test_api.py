@@ -1,12 +1,18 @@
 """
 Unit tests for Secret Hitler Online API endpoints.
 """
+import msgpack
 import pytest
+from datetime import datetime
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.api.main import app
-from app.services.game_manager import GameManager
+from app.api.models import BoardStateResponse, GamePhase, GameStateResponse, GameStatus
+from app.api.websocket_manager import MSGPACK_SUBPROTOCOL
+from app.models.game_models import Game, GamePhase as ModelGamePhase
+from app.services.game_engine import GameEngine
+from app.services.game_manager import GameManager, GameNotFoundError
 from app.services.ai_integration import AIIntegrationService
 
 @pytest.fixture
@@ -30,6 +36,21 @@ def mock_ai_integration():
     integration = AsyncMock(spec=AIIntegrationService)
     return integration
 
+def _manager_with_game(game_id):
+    """A real GameManager holding one five-player game under ``game_id``."""
+    manager = GameManager()
+    game = Game.create_new_game(["Alice", "Bob", "Charlie", "Diana", "Eve"])
+    manager.active_games[game_id] = {
+        "game": game,
+        "engine": GameEngine(game),
+        "players": {p.id: p for p in game.players},
+        "created_at": datetime.now(),
+        "last_activity": datetime.now(),
+        "status": GameStatus.WAITING,
+        "state_version": 0
+    }
+    return manager
+
 class TestGameManagementEndpoints:
     """Test game management endpoints."""
 
@@ -73,7 +94,8 @@ class TestGameManagementEndpoints:
             assert response.status_code == 400
             data = response.json()
             assert data["success"] is False
-            assert "Game not found" in data["error"]["details"]["message"]
+            assert data["error"] == "Cannot join game"
+            assert data["details"]["message"] == "Game not found"
 
     def test_start_game_success(self, client, mock_game_manager, mock_ai_integration):
         """Test successful game start."""
@@ -118,6 +140,36 @@ class TestPlayerActionEndpoints:
             data = response.json()
             assert data["success"] is True
 
+    def test_vote_schedules_ai_turns(self, client, mock_game_manager, mock_ai_integration):
+        """Test that AI turn processing runs as a background task after the vote."""
+        mock_game_manager.submit_vote.return_value = {"vote": True}
+
+        with patch('app.api.main.game_manager', mock_game_manager), \
+             patch('app.api.main.ai_integration', mock_ai_integration):
+
+            response = client.post("/api/games/test-game/vote?player_id=player-1",
+                                 json={"vote": True})
+
+            assert response.status_code == 200
+            mock_ai_integration.process_ai_turns.assert_awaited_once_with("test-game")
+
+    def test_submit_vote_invalid(self, client, mock_game_manager, mock_ai_integration):
+        """Test that a rejected vote returns a 400 error payload without scheduling AI turns."""
+        mock_game_manager.submit_vote.side_effect = ValueError("Not in voting phase")
+
+        with patch('app.api.main.game_manager', mock_game_manager), \
+             patch('app.api.main.ai_integration', mock_ai_integration):
+
+            response = client.post("/api/games/test-game/vote?player_id=player-1",
+                                 json={"vote": True})
+
+            assert response.status_code == 400
+            data = response.json()
+            assert data["success"] is False
+            assert data["error"] == "Invalid vote"
+            assert data["details"]["message"] == "Not in voting phase"
+            mock_ai_integration.process_ai_turns.assert_not_awaited()
+
     def test_send_chat_message_success(self, client, mock_game_manager, mock_ai_integration):
         """Test successful chat message sending."""
         mock_game_manager.send_chat_message.return_value = {
@@ -143,17 +195,23 @@ class TestGameStateEndpoints:
 
     def test_get_game_state_success(self, client, mock_game_manager):
         """Test successful game state retrieval."""
-        mock_game_state = MagicMock()
-        mock_game_state.id = "test-game"
-        mock_game_state.status.value = "in_progress"
-        mock_game_state.phase.value = "election"
-        mock_game_state.players = []
-        mock_game_state.board = MagicMock()
-        mock_game_state.current_president = "player-1"
-        mock_game_state.current_chancellor = "player-2"
-        mock_game_state.winner = None
-
-        mock_game_manager.get_game_state.return_value = mock_game_state
+        mock_game_state = GameStateResponse(
+            id="test-game",
+            status=GameStatus.IN_PROGRESS,
+            phase=GamePhase.ELECTION,
+            players=[],
+            board=BoardStateResponse(
+                liberal_policies=0,
+                fascist_policies=0,
+                election_tracker=0,
+                failed_elections=0,
+                veto_power_available=False
+            ),
+            current_president="player-1",
+            current_chancellor="player-2"
+        )
+
+        mock_game_manager.get_game_state_json.return_value = mock_game_state.model_dump_json().encode()
 
         with patch('app.api.main.game_manager', mock_game_manager):
             response = client.get("/api/games/test-game")
@@ -163,6 +221,21 @@ class TestGameStateEndpoints:
             assert data["id"] == "test-game"
             assert data["status"] == "in_progress"
 
+    def test_get_game_state_real_game_served_from_cache(self, client):
+        """Test that a real game's state is built once and then served from the cache."""
+        manager = _manager_with_game("test-game")
+
+        with patch('app.api.main.game_manager', manager), \
+                patch.object(manager, "get_game_state", wraps=manager.get_game_state) as get_game_state:
+            first = client.get("/api/games/test-game")
+            second = client.get("/api/games/test-game")
+
+            assert first.status_code == 200
+            assert first.json()["id"] == "test-game"
+            assert len(first.json()["players"]) == 5
+            assert second.content == first.content
+            assert get_game_state.await_count == 1
+
     def test_get_players_success(self, client, mock_game_manager):
         """Test successful players list retrieval."""
         mock_players = [MagicMock(id="p1", name="Player1", is_alive=True)]
@@ -175,6 +248,84 @@ class TestGameStateEndpoints:
             data = response.json()
             assert isinstance(data, list)
 
+    def test_get_board_state_not_modified(self, client, mock_game_manager):
+        """Test that a matching If-None-Match skips rebuilding the board state."""
+        mock_game_manager.get_state_etag = MagicMock(return_value='W/"test-game:3.7"')
+        mock_game_manager.get_board_state.return_value = {
+            "liberal_policies": 1,
+            "fascist_policies": 2,
+            "election_tracker": 0,
+            "failed_elections": 0,
+            "veto_power_available": False
+        }
+
+        with patch('app.api.main.game_manager', mock_game_manager):
+            response = client.get("/api/games/test-game/board")
+
+            assert response.status_code == 200
+            assert response.headers["etag"] == 'W/"test-game:3.7"'
+            assert response.json()["fascist_policies"] == 2
+
+            response = client.get("/api/games/test-game/board",
+                                  headers={"If-None-Match": 'W/"test-game:3.7"'})
+
+            assert response.status_code == 304
+            mock_game_manager.get_board_state.assert_awaited_once()
+
+    def test_if_none_match_forms(self, client, mock_game_manager):
+        """Test If-None-Match lists, weak comparison and the * wildcard."""
+        mock_game_manager.get_state_etag = MagicMock(return_value='W/"test-game:3.7"')
+        mock_game_manager.get_board_state.return_value = {}
+
+        expected = {
+            'W/"test-game:3.7"': 304,
+            '"test-game:3.7"': 304,
+            'W/"test-game:1.0", W/"test-game:3.7"': 304,
+            '"other",W/"test-game:3.7"': 304,
+            '*': 304,
+            'W/"test-game:3.6"': 200,
+            'W/"test-game:1.0", "test-game:3.6"': 200,
+        }
+
+        with patch('app.api.main.game_manager', mock_game_manager):
+            for header, status_code in expected.items():
+                response = client.get("/api/games/test-game/board", headers={"If-None-Match": header})
+                assert response.status_code == status_code, header
+
+    def test_get_current_turn_real_game(self, client):
+        """Test whose-turn information for a real game in the election phase."""
+        manager = _manager_with_game("test-game")
+        game = manager.active_games["test-game"]["game"]
+        president_id = game.players[0].id
+        game.game_state.phase = ModelGamePhase.ELECTION
+        game.game_state.presidential_candidate_id = president_id
+        game.mark_dirty()
+
+        with patch('app.api.main.game_manager', manager):
+            response = client.get("/api/games/test-game/turn")
+
+            assert response.status_code == 200
+            data = response.json()["data"]
+            assert data["current_player"] == president_id
+            assert data["is_player_turn"][president_id] is True
+            assert len(data["is_player_turn"]) == 5
+
+            response = client.get("/api/games/test-game/turn",
+                                  headers={"If-None-Match": response.headers["etag"]})
+            assert response.status_code == 304
+
+    def test_get_board_state_game_not_found(self, client, mock_game_manager):
+        """Test that an unknown game maps to a 404 error payload."""
+        mock_game_manager.get_state_etag = MagicMock(side_effect=GameNotFoundError("Game not found"))
+
+        with patch('app.api.main.game_manager', mock_game_manager):
+            response = client.get("/api/games/missing-game/board")
+
+            assert response.status_code == 404
+            data = response.json()
+            assert data["success"] is False
+            assert data["details"]["message"] == "Game not found"
+
     def test_get_available_actions_success(self, client, mock_game_manager):
         """Test successful available actions retrieval."""
         mock_actions = MagicMock()
@@ -201,6 +352,64 @@ class TestHealthEndpoint:
         assert data["status"] == "healthy"
         assert data["service"] == "secret-hitler-api"
 
+class TestWebSocket:
+    """Test WebSocket control messages."""
+
+    def test_msgpack_ping(self, client):
+        """Test that binary frames are decoded and answered as msgpack."""
+        with client.websocket_connect("/ws/test-game?player_id=p1") as websocket:
+            assert websocket.receive_json()["type"] == "connection_established"
+
+            websocket.send_bytes(msgpack.packb({"type": "ping"}))
+            pong = msgpack.unpackb(websocket.receive_bytes(), raw=False)
+
+            assert pong["type"] == "pong"
+            assert "quality" in pong
+
+    def test_msgpack_subprotocol(self, client):
+        """Test that clients negotiating the msgpack subprotocol receive binary frames."""
+        with client.websocket_connect("/ws/test-game?player_id=p1",
+                                      subprotocols=[MSGPACK_SUBPROTOCOL]) as websocket:
+            assert websocket.accepted_subprotocol == MSGPACK_SUBPROTOCOL
+
+            message = msgpack.unpackb(websocket.receive_bytes(), raw=False)
+
+            assert message["type"] == "connection_established"
+            assert isinstance(message["timestamp"], str)
+
+    def test_json_ping(self, client):
+        """Test that text frames are still answered as JSON."""
+        with client.websocket_connect("/ws/test-game?player_id=p1") as websocket:
+            websocket.receive_json()
+
+            websocket.send_json({"type": "ping"})
+
+            assert websocket.receive_json()["type"] == "pong"
+
+class TestCORS:
+    """Test CORS handling."""
+
+    def test_preflight_request(self, client):
+        """Test that preflight requests are answered with CORS headers."""
+        response = client.options("/api/games/create", headers={
+            "Origin": "http://example.com",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type"
+        })
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://example.com"
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert response.headers["access-control-allow-headers"] == "content-type"
+
+    def test_simple_request_headers(self, client):
+        """Test that regular responses carry CORS headers."""
+        response = client.get("/health", headers={"Origin": "http://example.com"})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://example.com"
+        assert response.headers["access-control-allow-credentials"] == "true"
+
 class TestErrorHandling:
     """Test error handling."""
 
@@ -216,6 +425,17 @@ class TestErrorHandling:
             assert data["success"] is False
             assert "error" in data
 
+    def test_internal_value_error_is_not_a_404(self, mock_game_manager):
+        """Test that a ValueError other than an unknown game surfaces as a server error."""
+        mock_game_manager.get_state_etag = MagicMock(side_effect=ValueError("bad internal state"))
+        client = TestClient(app, raise_server_exceptions=False)
+
+        with patch('app.api.main.game_manager', mock_game_manager):
+            response = client.get("/api/games/test-game/board")
+
+            assert response.status_code == 500
+            assert response.json()["error"] == "Internal server error"
+
     def test_validation_error(self, client):
         """Test request validation error."""
         response = client.post("/api/games/create", json={})  # Missing required field
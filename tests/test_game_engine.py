@@ -33,7 +33,7 @@ class TestGameEngineInitialization:
         engine = GameEngine(game)
 
         assert engine.game == game
-        assert engine.event_history == []
+        assert len(engine.event_history) == 0
         assert engine.get_current_phase() == GamePhase.LOBBY
 
     def test_engine_initialization_invalid_game(self):
@@ -253,6 +253,38 @@ class TestVoting:
             engine.submit_vote("player_0", True)
 
 
+    def test_player_joined_in_place_can_vote(self):
+        """Test that a player appended to the list before the start is a full voter."""
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        engine = GameEngine(game)
+        game.players.append(Player(id="late", name="Late", role=Role.LIBERAL, is_human=True))
+        engine.start_game()
+
+        game.game_state.phase = GamePhase.ELECTION
+        game.game_state.presidential_candidate_id = "player_0"
+        engine.nominate_chancellor("player_0", "player_1")
+
+        assert engine._is_valid_player("late")
+        assert engine.submit_vote("late", True)["status"] == "vote_recorded"
+        assert engine._expected_votes == 4
+
+    def test_last_vote_closes_nominated_election(self):
+        """Test that the final expected vote processes the election."""
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        engine = GameEngine(game)
+        engine.start_game()
+
+        game.game_state.phase = GamePhase.ELECTION
+        game.game_state.presidential_candidate_id = "player_0"
+        engine.nominate_chancellor("player_0", "player_1")
+
+        assert engine.submit_vote("player_2", True)["status"] == "vote_recorded"
+        assert engine.submit_vote("player_3", True)["status"] == "vote_recorded"
+        result = engine.submit_vote("player_4", True)
+
+        assert result["status"] == "government_formed"
+        assert game.game_state.phase == GamePhase.LEGISLATIVE_SESSION
+
 class TestElectionProcessing:
     """Test election result processing."""
 
@@ -536,10 +568,12 @@ class TestEventSystem:
         game_started_event = next(event for event in engine.event_history
                                 if event["event_type"] == EventType.GAME_STARTED.value)
         assert game_started_event["event_type"] == EventType.GAME_STARTED.value
-        assert "timestamp" in game_started_event
+        assert isinstance(game_started_event["timestamp_ns"], int)
+        assert datetime.fromisoformat(GameEngine.format_timestamp(game_started_event["timestamp_ns"]))
         assert "game_id" in game_started_event
         assert "data" in game_started_event
-        assert "game_state" in game_started_event
+        assert game_started_event["state_version"] <= engine.state_version
+        assert engine.get_snapshot()["game_state"]["phase"] == GamePhase.ROLE_REVEAL
 
     def test_event_types(self):
         """Test different event types are generated."""
@@ -559,6 +593,55 @@ class TestEventSystem:
         assert EventType.PHASE_CHANGED.value in events
         assert EventType.CHANCELLOR_NOMINATED.value in events
 
+    def test_event_history_is_capped(self):
+        """Test that the oldest events are spilled once the history is full."""
+        spilled = []
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        with patch("app.services.game_engine.EVENT_HISTORY_CAP", 1):
+            engine = GameEngine(game, spill_callback=spilled.append)
+        engine.start_game()
+
+        assert [e["event_type"] for e in engine.event_history] == [EventType.GAME_STARTED.value]
+        assert [e["event_type"] for e in spilled] == [EventType.PHASE_CHANGED.value]
+
+
+    def test_subscribers_receive_events_without_history(self):
+        """Test that subscribers get events even when history is disabled."""
+        received = []
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        engine = GameEngine(game, history_enabled=False)
+        engine.subscribe(received.append)
+        engine.start_game()
+
+        assert len(engine.event_history) == 0
+        assert [e["event_type"] for e in received] == [
+            EventType.PHASE_CHANGED.value, EventType.GAME_STARTED.value
+        ]
+
+
+    def test_simulate_restores_game(self):
+        """Test that moves made inside simulate() are rolled back without events."""
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        engine = GameEngine(game)
+        engine.start_game()
+        game.game_state.phase = GamePhase.ELECTION
+        game.game_state.presidential_candidate_id = "player_0"
+        events_before = len(engine.event_history)
+
+        first_player = game.players[0]
+
+        with engine.simulate():
+            engine.nominate_chancellor("player_0", "player_1")
+            assert game.game_state.chancellor_candidate_id == "player_1"
+            game.eliminate_player("player_2")
+
+        assert engine.game is game
+        assert game.players[0] is first_player
+        assert game.players_by_id["player_2"].is_alive
+        assert game.game_state.chancellor_candidate_id is None
+        assert game.game_state.phase == GamePhase.ELECTION
+        assert len(engine.event_history) == events_before
+
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
@@ -595,6 +678,26 @@ class TestEdgeCases:
         assert len(game.policy_deck) == 14  # 17 - 3 drawn
 
 
+    def test_illegal_phase_transition_rejected(self):
+        """Test that the engine refuses to skip phases."""
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        engine = GameEngine(game)
+
+        with pytest.raises(WrongPhaseError, match="Cannot move from lobby"):
+            engine._transition_to_phase(GamePhase.PRESIDENTIAL_POWER)
+        assert game.game_state.phase == GamePhase.LOBBY
+
+    def test_eligible_chancellors_recomputed_after_change(self):
+        """Test that cached chancellor eligibility follows game changes."""
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        engine = GameEngine(game)
+
+        assert engine._validate_chancellor_nomination("player_0", "player_1")
+        assert engine._validate_chancellor_nomination("player_0", "player_1")
+
+        game.eliminate_player("player_1")
+        assert not engine._validate_chancellor_nomination("player_0", "player_1")
+
 class TestPerformance:
     """Test performance characteristics."""
 
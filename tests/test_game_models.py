@@ -5,6 +5,8 @@ This module tests all models, enums, and game logic to ensure correctness
 and robustness of the data structures.
 """
 
+import pickle
+
 import pytest
 from app.models.game_models import (
     Role, Party, PolicyType, GamePhase, PresidentialPower,
@@ -84,6 +86,25 @@ class TestPlayerModel:
         assert not fascist.is_hitler()
         assert hitler.is_hitler()
 
+    def test_party_follows_role_reassignment(self):
+        player = Player(id="p1", name="Alice", role=Role.LIBERAL, is_human=True)
+        player.role = Role.HITLER
+
+        assert player.party == Party.FASCIST
+        assert player.is_fascist()
+        assert player.is_hitler()
+
+    def test_role_flags_survive_copy_and_pickle(self):
+        player = Player.model_construct(id="p1", name="Alice", role=Role.LIBERAL, is_human=True)
+
+        hitler = player.model_copy(update={"role": Role.HITLER})
+        assert hitler.party == Party.FASCIST
+        assert hitler.is_hitler()
+
+        restored = pickle.loads(pickle.dumps(player))
+        assert restored.party == Party.LIBERAL
+        assert not restored.is_fascist()
+
     def test_player_json_serialization(self):
         player = Player(id="p1", name="Alice", role=Role.LIBERAL, is_human=True)
         data = player.model_dump()
@@ -179,6 +200,14 @@ class TestGameModel:
         assert game.players[3].id in eligible_ids
         assert game.players[4].id in eligible_ids
 
+    def test_get_eligible_chancellors_skips_eliminated(self):
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        game.eliminate_player(game.players[3].id)
+
+        eligible = game.get_eligible_chancellors(game.players[0].id)
+
+        assert eligible == [game.players[1], game.players[2], game.players[4]]
+
     def test_process_votes_success(self):
         game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
         game.game_state.presidential_candidate_id = game.players[0].id
@@ -349,4 +378,84 @@ class TestGameModel:
         # Check that we can deserialize back
         restored_game = Game.model_validate(data)
         assert len(restored_game.players) == 5
-        assert restored_game.game_state.phase == GamePhase.LOBBY
\ No newline at end of file
+        assert restored_game.game_state.phase == GamePhase.LOBBY
+
+    def test_from_trusted_dict_round_trip(self):
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        game.game_state.government_history.append((game.players[0].id, game.players[1].id))
+        game.game_state.investigated_players[game.players[2].id] = game.players[2].party
+
+        restored = Game.from_trusted_dict(game.model_dump(mode="json"))
+
+        assert restored.model_dump() == game.model_dump()
+        assert restored.players[0].role is game.players[0].role
+        assert restored.game_state.government_history[0] == (game.players[0].id, game.players[1].id)
+
+    def test_eliminate_player_updates_alive_count(self):
+        players = [f"Player{i}" for i in range(9)]
+        game = Game.create_new_game(players)
+        game.game_state.fascist_policies = 3
+        assert game.get_presidential_power() == PresidentialPower.POLICY_PEEK
+
+        # Dropping below 9 living players switches to the 5-8 player board
+        game.eliminate_player(game.players[0].id)
+        game.eliminate_player(game.players[0].id)
+        assert game.get_presidential_power() == PresidentialPower.CALL_SPECIAL_ELECTION
+        assert game.alive_count == 8
+        assert game.players[0].id not in game.alive_players_by_id
+
+    def test_player_indexes_follow_in_place_edits(self):
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        assert game.alive_count == 5
+
+        late = Player(id="late", name="Late", role=Role.LIBERAL, is_human=True)
+        game.players.append(late)
+        game.mark_dirty()
+
+        assert game.players_by_id["late"] is late
+        assert game.alive_count == 6
+
+        restored = pickle.loads(pickle.dumps(game))
+        assert set(restored.players_by_id) == set(game.players_by_id)
+
+    def test_direct_player_edits_refresh_indexes(self):
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        version = game.version
+        hitler = next(p for p in game.players if p.is_hitler())
+        liberal = next(p for p in game.players if p.role == Role.LIBERAL)
+
+        hitler.is_alive = False
+        assert game.version != version
+        assert hitler.id not in game.alive_players_by_id
+        assert game.check_win_condition() == Party.LIBERAL
+
+        # Swapping roles moves the Hitler lookup with them
+        hitler.is_alive = True
+        hitler.role, liberal.role = Role.LIBERAL, Role.HITLER
+        liberal.is_alive = False
+        assert game.check_win_condition() == Party.LIBERAL
+
+        restored = pickle.loads(pickle.dumps(game))
+        version = restored.version
+        restored.players[0].is_alive = False
+        assert restored.version != version
+
+    def test_draw_policies_takes_from_top(self):
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        game.policy_deck = [PolicyType.FASCIST, PolicyType.LIBERAL, PolicyType.FASCIST, PolicyType.LIBERAL]
+
+        drawn = game.draw_policies(3)
+
+        assert drawn == [PolicyType.LIBERAL, PolicyType.FASCIST, PolicyType.LIBERAL]
+        assert game.policy_deck == [PolicyType.FASCIST]
+
+    def test_peek_policies_matches_next_draw(self):
+        game = Game.create_new_game(["Alice", "Bob", "Charlie", "Dave", "Eve"])
+        game.policy_deck = [PolicyType.LIBERAL]
+        game.discard_pile = [PolicyType.FASCIST, PolicyType.FASCIST]
+
+        peeked = game.peek_policies(3)
+
+        assert peeked[0] == PolicyType.LIBERAL
+        assert len(game.policy_deck) == 3
+        assert game.draw_policies(3) == peeked
@@ -0,0 +1,266 @@
+"""
+Unit tests for the WebSocketManager.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import msgpack
+import orjson
+from starlette.websockets import WebSocketState
+
+from app.api.websocket_manager import MSGPACK_SUBPROTOCOL, OUTBOUND_QUEUE_SIZE, WebSocketManager
+
+class FakeWebSocket:
+    """Minimal stand-in for a Starlette WebSocket that records what is sent."""
+
+    def __init__(self, subprotocols=()):
+        self.scope = {"subprotocols": list(subprotocols)}
+        self.client_state = WebSocketState.CONNECTED
+        self.sent = []
+        self.closed_reason = None
+
+    async def accept(self, subprotocol=None):
+        pass
+
+    async def send_text(self, data):
+        self.sent.append(data)
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+    async def close(self, code=1000, reason=None):
+        self.client_state = WebSocketState.DISCONNECTED
+        self.closed_reason = reason
+
+def _received(websocket):
+    """Decode the JSON frames a fake socket was sent, unpacking batch frames."""
+    messages = []
+    for frame in websocket.sent:
+        message = orjson.loads(frame)
+        messages.extend(message["messages"] if message["type"] == "batch" else [message])
+    return messages
+
+def _fake_redis():
+    """A Redis client whose subscriber can never connect."""
+    redis = MagicMock()
+    redis.publish = AsyncMock()
+    redis.aclose = AsyncMock()
+    redis.pubsub.side_effect = ConnectionError("redis unavailable")
+    return redis
+
+class FakePubSub:
+    """In-memory pattern subscription fed by FakeRedis.publish."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.closed = False
+
+    async def psubscribe(self, pattern):
+        await self.redis.subscribe_allowed.wait()
+
+    async def listen(self):
+        while True:
+            if self.redis.fail_listen:
+                raise ConnectionError("connection lost")
+            channel, data = await self.redis.published.get()
+            yield {"type": "pmessage", "channel": channel.encode(), "data": data}
+
+    async def aclose(self):
+        self.closed = True
+
+class FakeRedis:
+    """Redis stand-in whose subscriber only comes up once subscribe_allowed is set."""
+
+    def __init__(self, fail_listen=False):
+        self.published = asyncio.Queue()
+        self.subscribe_allowed = asyncio.Event()
+        self.fail_listen = fail_listen
+        self.pubsubs = []
+
+    def pubsub(self):
+        pubsub = FakePubSub(self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def publish(self, channel, data):
+        self.published.put_nowait((channel, data))
+
+    async def aclose(self):
+        pass
+
+class TestRedisFanOut:
+    """Broadcasting with Redis configured."""
+
+    def test_connect_starts_subscriber(self):
+        async def run_test():
+            manager = WebSocketManager()
+            manager.redis = _fake_redis()
+
+            await manager.connect(FakeWebSocket(), "game1", "player1")
+            assert manager.subscribe_task is not None
+
+            await manager.shutdown()
+
+        asyncio.run(run_test())
+
+    def test_broadcast_delivers_locally_while_not_subscribed(self):
+        async def run_test():
+            manager = WebSocketManager()
+            manager.redis = _fake_redis()
+            websocket = FakeWebSocket()
+            await manager.connect(websocket, "game1", "player1")
+
+            await manager.broadcast_to_game("game1", {"type": "game_update"})
+            await asyncio.sleep(0.05)
+
+            manager.redis.publish.assert_awaited_once()
+            assert [m["type"] for m in _received(websocket)] == ["connection_established", "game_update"]
+
+            await manager.shutdown()
+
+        asyncio.run(run_test())
+
+    def test_broadcast_during_subscriber_startup_is_delivered_once(self):
+        async def run_test():
+            manager = WebSocketManager()
+            manager.redis = FakeRedis()
+            websocket = FakeWebSocket()
+            await manager.connect(websocket, "game1", "player1")
+
+            # Delivered locally because the subscriber is not listening yet...
+            await manager.broadcast_to_game("game1", {"type": "game_update", "seq": 0})
+            # ...and its Redis copy is dropped once the subscriber comes up
+            manager.redis.subscribe_allowed.set()
+            await asyncio.sleep(0.05)
+            assert manager._subscribed
+
+            await manager.broadcast_to_game("game1", {"type": "game_update", "seq": 1})
+            await asyncio.sleep(0.05)
+
+            assert [m.get("seq") for m in _received(websocket)] == [None, 0, 1]
+
+            await manager.shutdown()
+
+        asyncio.run(run_test())
+
+    def test_subscriber_closes_pubsub_when_it_fails(self):
+        async def run_test():
+            manager = WebSocketManager()
+            manager.redis = FakeRedis(fail_listen=True)
+            manager.redis.subscribe_allowed.set()
+            await manager.connect(FakeWebSocket(), "game1", "player1")
+            await asyncio.sleep(0.05)
+
+            assert manager.redis.pubsubs[0].closed
+            assert not manager._subscribed
+
+            await manager.shutdown()
+
+        asyncio.run(run_test())
+
+class TestBroadcast:
+    """Local fan-out of broadcasts."""
+
+    def test_broadcast_leaves_message_untouched_and_serializes_once_per_format(self):
+        async def run_test():
+            manager = WebSocketManager()
+            text_sockets = [FakeWebSocket() for _ in range(3)]
+            binary_socket = FakeWebSocket(subprotocols=[MSGPACK_SUBPROTOCOL])
+            for i, websocket in enumerate(text_sockets + [binary_socket]):
+                await manager.connect(websocket, "game1", f"player{i}")
+            await asyncio.sleep(0.05)
+
+            message = {"type": "game_update"}
+            with patch.object(manager, "serialize", wraps=manager.serialize) as serialize:
+                await manager.broadcast_to_game("game1", message)
+            await asyncio.sleep(0.05)
+
+            assert message == {"type": "game_update"}
+            assert serialize.call_count == 2
+            assert all(_received(websocket)[-1]["type"] == "game_update" for websocket in text_sockets)
+            assert msgpack.unpackb(binary_socket.sent[-1])["type"] == "game_update"
+
+            await manager.shutdown()
+
+        asyncio.run(run_test())
+
+class BlockedWebSocket(FakeWebSocket):
+    """A socket whose sends never complete, like a client that stopped reading."""
+
+    async def send_text(self, data):
+        await asyncio.Event().wait()
+
+class TestOutboundQueue:
+    """Per-connection writer queues and batch framing."""
+
+    def test_frames_are_sent_in_order_and_bursts_batched(self):
+        async def run_test():
+            manager = WebSocketManager()
+            websocket = FakeWebSocket()
+            connection_id = await manager.connect(websocket, "game1", "player1")
+
+            for i in range(5):
+                await manager._send_message(connection_id, {"type": "update", "seq": i})
+            await asyncio.sleep(0.05)
+
+            # The burst, including the connection confirmation, goes out as one batch frame
+            assert len(websocket.sent) == 1
+            assert orjson.loads(websocket.sent[0])["type"] == "batch"
+            assert [m.get("seq") for m in _received(websocket)] == [None, 0, 1, 2, 3, 4]
+
+            await manager.shutdown()
+
+        asyncio.run(run_test())
+
+    def test_binary_burst_is_batched_as_msgpack(self):
+        async def run_test():
+            manager = WebSocketManager()
+            websocket = FakeWebSocket(subprotocols=[MSGPACK_SUBPROTOCOL])
+            connection_id = await manager.connect(websocket, "game1", "player1")
+            await manager._send_message(connection_id, {"type": "update"})
+            await asyncio.sleep(0.05)
+
+            batch = msgpack.unpackb(websocket.sent[0])
+            assert batch["type"] == "batch"
+            assert [m["type"] for m in batch["messages"]] == ["connection_established", "update"]
+
+            await manager.shutdown()
+
+        asyncio.run(run_test())
+
+    def test_mixed_formats_are_not_batched_together(self):
+        async def run_test():
+            manager = WebSocketManager()
+            websocket = FakeWebSocket(subprotocols=[MSGPACK_SUBPROTOCOL])
+            connection_id = await manager.connect(websocket, "game1", "player1")
+            await manager.send_to_connection(connection_id, '{"type":"pong"}')
+            await asyncio.sleep(0.05)
+
+            assert msgpack.unpackb(websocket.sent[0])["type"] == "connection_established"
+            assert orjson.loads(websocket.sent[1])["type"] == "pong"
+
+            await manager.shutdown()
+
+        asyncio.run(run_test())
+
+    def test_slow_consumer_is_disconnected(self):
+        async def run_test():
+            manager = WebSocketManager()
+            websocket = BlockedWebSocket()
+            connection_id = await manager.connect(websocket, "game1", "player1")
+            await asyncio.sleep(0.05)  # The writer is now stuck sending the confirmation
+
+            for i in range(OUTBOUND_QUEUE_SIZE + 1):
+                manager._enqueue(connection_id, '{"type":"update"}')
+            assert len(manager._background_tasks) == 1  # The disconnect is held until it finishes
+            await asyncio.sleep(0)
+
+            assert connection_id not in manager.active_connections
+            assert connection_id not in manager.outbound_queues
+            assert websocket.closed_reason == "slow_consumer"
+            await asyncio.sleep(0)  # Done callbacks run on the next loop iteration
+            assert not manager._background_tasks
+
+            await manager.shutdown()
+
+        asyncio.run(run_test())